@@ -1,25 +1,21 @@
 """Command-line interface for OneImage."""
 
 import os
+import re
 import sys
+from contextlib import contextmanager
 from enum import Enum
 from pathlib import Path
-from typing import Optional, Annotated
+from typing import Any, Dict, Final, FrozenSet, Iterator, List, Optional, Tuple, Union
 
 import typer
-from loguru import logger
-from rich import print
-from rich.console import Console
-from rich.panel import Panel
-
-from ..core.converter import ImageConverter
-from ..core.watermark import WatermarkProcessor
-from ..utils.validators import ValidationError
+
 from ..config.settings import (
     DEFAULT_LOG_FORMAT,
     DEFAULT_LOG_LEVEL,
     DEFAULT_LOG_ROTATION,
     SUPPORTED_FORMATS,
+    SUPPORTED_FORMATS_DISPLAY,
 )
 
 
@@ -30,8 +26,115 @@ app = typer.Typer(
     add_completion=True,
 )
 
-# Create console for rich output
-console = Console()
+# Heavy dependencies (loguru, rich, PIL, rembg) are imported on first use so
+# that --help and --version stay fast.
+_LOGGER = None
+_CONSOLE = None
+
+# Colored format used when logs are shown in the console
+_CONSOLE_FORMAT: Final[str] = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
+    "<level>{level: <8}</level> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
+    "<level>{message}</level>\n"
+    "{exception}"
+)
+
+# Directory holding the application log file, unless overridden by the
+# environment variable below
+_LOG_DIR = Path("logs")
+_LOG_DIR_ENV: Final[str] = "ONEIMAGE_LOG_DIR"
+
+# (show_logs, log_level, quiet) of the active logging configuration
+_LOGGING_CONFIGURED: Optional[Tuple[bool, str, bool]] = None
+
+# Set by --quiet; disables logging for the whole invocation
+_QUIET: bool = False
+
+# Panels are only rendered on terminals; piped output gets plain text
+_IS_TTY: Final[bool] = sys.stdout.isatty()
+
+# Opening and closing rich markup tags, e.g. [bold green] or [/], as matched
+# by rich.markup; an odd number of leading backslashes escapes the tag
+_MARKUP_TAG = re.compile(r"(\\*)\[([a-z#/@][^[]*?)]")
+
+
+def _log():
+    """Return the loguru logger, importing it on first use."""
+    global _LOGGER
+    if _LOGGER is None:
+        from loguru import logger
+        _LOGGER = logger
+    return _LOGGER
+
+
+def _console():
+    """Return the rich console used for output, creating it on first use."""
+    global _CONSOLE
+    if _CONSOLE is None:
+        from rich.console import Console
+        _CONSOLE = Console()
+    return _CONSOLE
+
+
+def _plain(message: str) -> str:
+    """Strip rich markup from a message without importing rich."""
+    def replace(match: re.Match) -> str:
+        backslashes, tag = match.groups()
+        if len(backslashes) % 2:
+            return f"{backslashes[:-1]}[{tag}]"
+        return backslashes[: len(backslashes) // 2]
+
+    return _MARKUP_TAG.sub(replace, message)
+
+
+def _emit_ok(
+    message: str, title: str = "Success", expand: bool = False, **panel_options
+) -> None:
+    """
+    Print a message in a panel, or as plain text when stdout is not a terminal.
+
+    Parameters
+    ----------
+    message : str
+        Message with rich markup
+    title : str, optional
+        Panel title, by default "Success"
+    expand : bool, optional
+        Whether the panel fills the terminal width, by default False
+    **panel_options
+        Additional options passed to rich.panel.Panel
+    """
+    if _IS_TTY:
+        from rich.panel import Panel
+        _console().print(Panel(message, title=title, expand=expand, **panel_options))
+    else:
+        typer.echo(_plain(message))
+
+
+def _emit(message: str) -> None:
+    """Print a line of rich markup, or plain text when stdout is not a terminal."""
+    if _IS_TTY:
+        _console().print(message)
+    else:
+        typer.echo(_plain(message))
+
+
+def _emit_err(message: str, panel: bool = False) -> None:
+    """
+    Print an error message, or plain text when stdout is not a terminal.
+
+    Parameters
+    ----------
+    message : str
+        Message with rich markup
+    panel : bool, optional
+        Whether to frame the message in a red error panel, by default False
+    """
+    if panel:
+        _emit_ok(message, title="Error", border_style="red")
+    else:
+        _emit(message)
 
 
 class LogLevel(str, Enum):
@@ -42,41 +145,104 @@ class LogLevel(str, Enum):
     ERROR = "ERROR"
 
 
-def setup_logging(show_logs: bool = False, log_level: LogLevel = LogLevel.INFO) -> None:
+# Plain level names accepted by setup_logging
+_VALID_LEVELS: Final[FrozenSet[str]] = frozenset(level.value for level in LogLevel)
+
+
+class ResizeBackend(str, Enum):
+    """Backends available to the resize command."""
+    PILLOW = "pillow"
+    VIPS = "vips"
+
+
+class BatchOperation(str, Enum):
+    """Operations available to the batch command."""
+    CONVERT = "convert"
+    RESIZE = "resize"
+    REMOVE_BG = "remove-bg"
+
+
+def setup_logging(
+    show_logs: Optional[bool] = None,
+    log_level: Optional[Union[LogLevel, str]] = None,
+) -> None:
     """
     Configure logging for the application.
 
     Parameters
     ----------
-    show_logs : bool, optional
-        Whether to show logs in console output, by default False
-    log_level : LogLevel, optional
-        The logging level to use, by default LogLevel.INFO
+    show_logs : Optional[bool], optional
+        Whether to show logs in console output, by default the current
+        setting, or False before logging has been configured
+    log_level : Optional[Union[LogLevel, str]], optional
+        The logging level to use, by default the current setting, or INFO
+        before logging has been configured. Plain level names are accepted
+        in any case.
+
+    Raises
+    ------
+    ValueError
+        If log_level is not a known level name
+
+    Notes
+    -----
+    Calling this again with the same arguments is a no-op, so commands can
+    request their own settings without rebuilding the log sinks. Commands
+    pass None for options the user did not give, keeping the global ones. When
+    --quiet was given, no sinks are added and OneImage's log calls are
+    disabled at the logger, regardless of the arguments.
+
+    The log file is written to ./logs, or to the directory named by the
+    ONEIMAGE_LOG_DIR environment variable.
     """
+    global _LOGGING_CONFIGURED
+
+    current = _LOGGING_CONFIGURED or (False, DEFAULT_LOG_LEVEL, False)
+    if show_logs is None:
+        show_logs = current[0]
+    if log_level is None:
+        log_level = current[1]
+
+    # Work with the plain level name from here on
+    log_level = getattr(log_level, "value", log_level)
+    if log_level not in _VALID_LEVELS:
+        log_level = log_level.upper()
+        if log_level not in _VALID_LEVELS:
+            raise ValueError(f"Unknown log level: {log_level}")
+
+    key = (show_logs, log_level, _QUIET)
+    if _LOGGING_CONFIGURED == key:
+        return
+    needs_log_dir = _LOGGING_CONFIGURED is None or _LOGGING_CONFIGURED[2]
+    _LOGGING_CONFIGURED = key
+
+    logger = _log()
+
     # Remove default logger
     logger.remove()
 
-    # Ensure logs directory exists
-    os.makedirs('logs', exist_ok=True)
-
-    # Define log formats
-    file_format = DEFAULT_LOG_FORMAT
-    console_format = (
-        "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
-        "<level>{level: <8}</level> | "
-        "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
-        "<level>{message}</level>\n"
-        "{exception}"
-    )
+    if _QUIET:
+        logger.disable("oneimage")
+        return
+    logger.enable("oneimage")
 
-    # Always log to file with default format
+    # Always log to file with default format. Records are written by a
+    # background thread through a buffered stream, and the file is only
+    # opened once the first record arrives.
+    log_dir = Path(os.environ.get(_LOG_DIR_ENV) or _LOG_DIR)
+    if needs_log_dir:
+        log_dir.mkdir(parents=True, exist_ok=True)
     logger.add(
-        "logs/oneimage.log",
+        str(log_dir / "oneimage.log"),
         rotation=DEFAULT_LOG_ROTATION,
         level=log_level,
-        format=file_format,
+        format=DEFAULT_LOG_FORMAT,
         backtrace=True,
         diagnose=True,
+        enqueue=True,
+        buffering=8192,
+        delay=True,
+        catch=True,
     )
 
     # Add console logger with colors if enabled
@@ -84,7 +250,7 @@ def setup_logging(show_logs: bool = False, log_level: LogLevel = LogLevel.INFO)
         logger.add(
             sys.stderr,
             level=log_level,
-            format=console_format,
+            format=_CONSOLE_FORMAT,
             colorize=True,
             backtrace=True,
             diagnose=True,
@@ -94,39 +260,45 @@ def setup_logging(show_logs: bool = False, log_level: LogLevel = LogLevel.INFO)
 def version_callback(value: bool):
     """Show version information."""
     if value:
-        from .. import __version__
-        print(Panel.fit(
-            f"[bold blue]OneImage[/bold blue] version: [green]{__version__}[/green]",
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            package_version = version("oneimage")
+        except PackageNotFoundError:
+            # Running from a source checkout that was never installed
+            from .. import __version__ as package_version
+        _emit_ok(
+            f"[bold blue]OneImage[/bold blue] version: "
+            f"[green]{package_version}[/green]",
             title="Version Info"
-        ))
+        )
         raise typer.Exit()
 
 
 @app.callback()
 def main(
-    logging: Annotated[
-        bool, typer.Option(
-            "--logging", "-l",
-            help="Enable console logging output",
-            show_default=True,
-        )
-    ] = False,
-    log_level: Annotated[
-        LogLevel, typer.Option(
-            "--log-level",
-            help="Set the logging level",
-            case_sensitive=False,
-            show_default=True,
-        )
-    ] = LogLevel.INFO,
-    version: Annotated[
-        bool, typer.Option(
-            "--version", "-v",
-            help="Show version information and exit",
-            callback=version_callback,
-            is_eager=True,
-        )
-    ] = False,
+    ctx: typer.Context,
+    logging: bool = typer.Option(
+        False, "--logging", "-l",
+        help="Enable console logging output",
+        show_default=True,
+    ),
+    log_level: LogLevel = typer.Option(
+        LogLevel.INFO, "--log-level",
+        help="Set the logging level",
+        case_sensitive=False,
+        show_default=True,
+    ),
+    quiet: bool = typer.Option(
+        False, "--quiet", "-Q",
+        help="Disable all logging, including the log file",
+    ),
+    version: bool = typer.Option(
+        False, "--version", "-v",
+        help="Show version information and exit",
+        callback=version_callback,
+        is_eager=True,
+    ),
 ) -> None:
     """
     OneImage - Command-line tool for image format conversion.
@@ -134,46 +306,62 @@ def main(
     This tool provides functionality to convert images between different formats
     while maintaining image quality and proper error handling.
     """
+    global _QUIET
+    _QUIET = quiet
     setup_logging(show_logs=logging, log_level=log_level)
 
+    # Drain queued log records once the command has finished
+    ctx.call_on_close(_log().complete)
+
 
 @app.command()
 def convert(
-    input_file: Annotated[
-        Path, typer.Argument(
-            help="Path to the input image file",
-            exists=True,
-            dir_okay=False,
-            resolve_path=True,
-        )
-    ],
-    output_file: Annotated[
-        Path, typer.Argument(
-            help="Path where the converted image will be saved",
-            dir_okay=False,
-            resolve_path=True,
-        )
-    ],
-    quality: Annotated[
-        Optional[int], typer.Option(
-            "--quality", "-q",
-            help="Output image quality (1-100)",
-            min=1,
-            max=100,
-        )
-    ] = None,
+    input_file: Path = typer.Argument(
+        ...,
+        help="Path to the input image file",
+        exists=True,
+        dir_okay=False,
+        resolve_path=True,
+    ),
+    output_file: Path = typer.Argument(
+        ...,
+        help="Path where the converted image will be saved",
+        dir_okay=False,
+        resolve_path=True,
+    ),
+    quality: Optional[int] = typer.Option(
+        None, "--quality", "-q",
+        help="Output image quality (1-100)",
+        min=1,
+        max=100,
+    ),
+    fast: bool = typer.Option(
+        False, "--fast/--no-fast",
+        help="Use fast encoder settings at the cost of larger files",
+    ),
+    compress_level: Optional[int] = typer.Option(
+        None, "--compress-level",
+        help="PNG compression level (0-9)",
+        min=0,
+        max=9,
+    ),
 ) -> None:
     """Convert an image from one format to another."""
+    from ..core.converter import ImageConverter
+    from ..utils.validators import (
+        ValidationError, validate_image_path, validate_quality
+    )
+
     try:
         # Validate output format
-        if output_file.suffix.lower() not in SUPPORTED_FORMATS:
-            supported_formats_str = ', '.join(sorted(SUPPORTED_FORMATS))
+        output_suffix = output_file.suffix.lower()
+        if output_suffix not in SUPPORTED_FORMATS:
             raise ValidationError(
-                f"Unsupported output format. Supported formats: {supported_formats_str}"
+                "Unsupported output format. "
+                f"Supported formats: {SUPPORTED_FORMATS_DISPLAY}"
             )
 
         # Validate paths
-        from ..utils.validators import validate_image_path, validate_quality
         validate_image_path(input_file, should_exist=True)
         validate_image_path(output_file, should_exist=False)
 
@@ -182,32 +370,32 @@ def convert(
             validate_quality(quality)
 
         # Show progress
-        with console.status(f"Converting {input_file.name} to {output_file.name}..."):
+        status = f"Converting {input_file.name} to {output_file.name}..."
+        with _console().status(status):
             # Convert the image
-            ImageConverter.convert_image(input_file, output_file, quality)
+            ImageConverter.convert_image(
+                input_file,
+                output_file,
+                quality,
+                suffix=output_suffix,
+                fast=fast,
+                compress_level=compress_level,
+            )
 
         # Show success message
-        print(Panel.fit(
-            f"[green]Successfully converted[/green] [bold]{input_file.name}[/bold] to [bold]{output_file.name}[/bold]",
-            title="Success"
-        ))
+        _emit_ok(
+            f"[green]Successfully converted[/green] [bold]{input_file.name}[/bold] "
+            f"to [bold]{output_file.name}[/bold]"
+        )
 
     except ValidationError as e:
-        logger.error(str(e))
-        print(Panel.fit(
-            f"[red]Error:[/red] {str(e)}",
-            title="Error",
-            border_style="red"
-        ))
+        _log().error(str(e))
+        _emit_err(f"[red]Error:[/red] {str(e)}", panel=True)
         sys.exit(1)
 
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
-        print(Panel.fit(
-            f"[red]Unexpected error:[/red] {str(e)}",
-            title="Error",
-            border_style="red"
-        ))
+        _log().error(f"Unexpected error: {str(e)}")
+        _emit_err(f"[red]Unexpected error:[/red] {str(e)}", panel=True)
         sys.exit(1)
 
 
@@ -215,12 +403,48 @@ def convert(
 def resize(
     input_file: Path = typer.Argument(..., help="Input image file path"),
     output_file: Path = typer.Argument(..., help="Output image file path"),
-    width: Optional[int] = typer.Option(None, "--width", "-w", help="Target width in pixels"),
-    height: Optional[int] = typer.Option(None, "--height", "-h", help="Target height in pixels"),
-    maintain_aspect_ratio: bool = typer.Option(True, "--no-aspect-ratio", help="Don't maintain aspect ratio", show_default=False),
-    quality: Optional[int] = typer.Option(None, "--quality", "-q", help="Output image quality (1-100)"),
-    show_logs: bool = typer.Option(False, "--show-logs", help="Show detailed logs"),
-    log_level: LogLevel = typer.Option(LogLevel.INFO, "--log-level", help="Log level"),
+    width: Optional[int] = typer.Option(
+        None, "--width", "-w",
+        help="Target width in pixels",
+    ),
+    height: Optional[int] = typer.Option(
+        None, "--height", "-h",
+        help="Target height in pixels",
+    ),
+    maintain_aspect_ratio: bool = typer.Option(
+        True, "--no-aspect-ratio",
+        help="Don't maintain aspect ratio",
+        show_default=False,
+    ),
+    quality: Optional[int] = typer.Option(
+        None, "--quality", "-q",
+        help="Output image quality (1-100)",
+    ),
+    fast: bool = typer.Option(
+        False, "--fast/--no-fast",
+        help="Use fast encoder settings at the cost of larger files",
+    ),
+    compress_level: Optional[int] = typer.Option(
+        None, "--compress-level",
+        help="PNG compression level (0-9)",
+        min=0,
+        max=9,
+    ),
+    backend: ResizeBackend = typer.Option(
+        ResizeBackend.PILLOW, "--backend",
+        help="Resize with Pillow, or stream images through libvips (needs pyvips)",
+        case_sensitive=False,
+    ),
+    show_logs: Optional[bool] = typer.Option(
+        None, "--show-logs",
+        help="Show detailed logs, by default as set by the global --logging",
+        show_default=False,
+    ),
+    log_level: Optional[LogLevel] = typer.Option(
+        None, "--log-level",
+        help="Log level, by default the global --log-level",
+        case_sensitive=False,
+    ),
 ) -> None:
     """
     Resize an image to specified dimensions.
@@ -229,13 +453,16 @@ def resize(
     If both dimensions are specified and --no-aspect-ratio is not used, the image will be resized to fit
     within the specified dimensions while maintaining aspect ratio.
     """
+    from ..core.converter import ImageConverter
+    from ..utils.validators import ValidationError
+
     try:
         # Setup logging
-        setup_logging(show_logs, log_level)
-        logger.debug("Starting resize command")
+        setup_logging(show_logs=show_logs, log_level=log_level)
+        _log().debug("Starting resize command")
 
         # Show resize operation details
-        console.print(Panel.fit(
+        _emit_ok(
             f"[bold]Resize Operation[/bold]\n"
             f"Input: [cyan]{input_file}[/cyan]\n"
             f"Output: [cyan]{output_file}[/cyan]\n"
@@ -244,9 +471,9 @@ def resize(
             f"Maintain Aspect Ratio: [cyan]{maintain_aspect_ratio}[/cyan]",
             title="OneImage",
             border_style="blue"
-        ))
+        )
 
-        with console.status(f"Resizing {input_file.name} to {output_file.name}..."):
+        with _console().status(f"Resizing {input_file.name} to {output_file.name}..."):
             # Resize the image
             ImageConverter.resize_image(
                 input_file,
@@ -254,26 +481,29 @@ def resize(
                 width=width,
                 height=height,
                 maintain_aspect_ratio=maintain_aspect_ratio,
-                quality=quality
+                quality=quality,
+                fast=fast,
+                compress_level=compress_level,
+                backend=backend.value,
             )
 
         # Show success message
-        print(Panel.fit(
+        _emit_ok(
             f"[green]Successfully resized[/green] [bold]{input_file.name}[/bold] to [bold]{output_file.name}[/bold]",
-            title="Success",
             border_style="green"
-        ))
+        )
 
     except ValidationError as e:
-        logger.error(f"Validation error: {str(e)}")
-        console.print(f"[red]Error:[/red] {str(e)}")
+        _log().error(f"Validation error: {str(e)}")
+        _emit_err(f"[red]Error:[/red] {str(e)}")
         sys.exit(1)
 
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
-        console.print("[red]An unexpected error occurred[/red]")
-        if show_logs:
-            console.print(f"[red]Error details:[/red] {str(e)}")
+        _log().error(f"Unexpected error: {str(e)}")
+        _emit_err("[red]An unexpected error occurred[/red]")
+        # Honour the global --logging as well as --show-logs
+        if _LOGGING_CONFIGURED is not None and _LOGGING_CONFIGURED[0]:
+            _emit_err(f"[red]Error details:[/red] {str(e)}")
         sys.exit(1)
 
 
@@ -284,17 +514,28 @@ def rotate(
     angle: float = typer.Option(90.0, help="Rotation angle in degrees (counter-clockwise)"),
     expand: bool = typer.Option(True, help="Expand output to fit rotated image"),
     quality: Optional[int] = typer.Option(None, help="Quality for lossy formats (1-100)"),
-    log_level: str = typer.Option("INFO", help="Logging level"),
+    show_logs: Optional[bool] = typer.Option(
+        None, "--show-logs",
+        help="Show detailed logs, by default as set by the global --logging",
+        show_default=False,
+    ),
+    log_level: Optional[LogLevel] = typer.Option(
+        None, "--log-level",
+        help="Log level, by default the global --log-level",
+        case_sensitive=False,
+    ),
 ):
     """
     Rotate an image by a specified angle.
     """
+    from ..core.converter import ImageConverter
+    from ..utils.validators import ValidationError
+
     try:
-        setup_logging(log_level)
-        logger.debug(f"Starting rotation with angle {angle}")
+        setup_logging(show_logs=show_logs, log_level=log_level)
+        _log().debug(f"Starting rotation with angle {angle}")
 
-        converter = ImageConverter()
-        converter.rotate_image(
+        ImageConverter.rotate_image(
             input_path=input_path,
             output_path=output_path,
             angle=angle,
@@ -302,13 +543,13 @@ def rotate(
             quality=quality,
         )
 
-        console.print(f"[green]Successfully rotated image:[/] {input_path} -> {output_path}")
+        _emit(f"[green]Successfully rotated image:[/] {input_path} -> {output_path}")
 
     except ValidationError as e:
-        console.print(f"[red]Validation error:[/] {str(e)}")
+        _emit_err(f"[red]Validation error:[/] {str(e)}")
         raise typer.Exit(1)
     except Exception as e:
-        console.print(f"[red]Unexpected error:[/] {str(e)}")
+        _emit_err(f"[red]Unexpected error:[/] {str(e)}")
         raise typer.Exit(1)
 
 
@@ -325,14 +566,26 @@ def watermark(
     font_size: int = typer.Option(36, help="Font size for watermark text"),
     font_color: str = typer.Option("white", help="Color of watermark text"),
     quality: Optional[int] = typer.Option(None, help="Quality for lossy formats (1-100)"),
-    log_level: str = typer.Option("INFO", help="Logging level"),
+    show_logs: Optional[bool] = typer.Option(
+        None, "--show-logs",
+        help="Show detailed logs, by default as set by the global --logging",
+        show_default=False,
+    ),
+    log_level: Optional[LogLevel] = typer.Option(
+        None, "--log-level",
+        help="Log level, by default the global --log-level",
+        case_sensitive=False,
+    ),
 ):
     """
     Add a text watermark to an image.
     """
+    from ..core.watermark import WatermarkProcessor
+    from ..utils.validators import ValidationError
+
     try:
-        setup_logging(show_logs=True, log_level=log_level)
-        logger.debug(f"Adding watermark to {input_path}")
+        setup_logging(show_logs=show_logs, log_level=log_level)
+        _log().debug(f"Adding watermark to {input_path}")
 
         WatermarkProcessor.add_watermark(
             input_path=input_path,
@@ -345,13 +598,13 @@ def watermark(
             quality=quality,
         )
 
-        console.print(f"[green]Successfully added watermark:[/] {input_path} -> {output_path}")
+        _emit(f"[green]Successfully added watermark:[/] {input_path} -> {output_path}")
 
     except ValidationError as e:
-        console.print(f"[red]Validation error:[/] {str(e)}")
+        _emit_err(f"[red]Validation error:[/] {str(e)}")
         raise typer.Exit(1)
     except Exception as e:
-        console.print(f"[red]Unexpected error:[/] {str(e)}")
+        _emit_err(f"[red]Unexpected error:[/] {str(e)}")
         raise typer.Exit(1)
 
 
@@ -359,13 +612,34 @@ def watermark(
 def remove_bg(
     input_path: Path = typer.Argument(..., help="Path to input image"),
     output_path: Path = typer.Argument(..., help="Path for output image"),
-    model: str = typer.Option("u2net", help="Model to use for background removal (u2net, u2netp, u2net_human_seg)"),
-    alpha_matting: bool = typer.Option(False, help="Use alpha matting for better edge detection"),
-    alpha_matting_foreground_threshold: int = typer.Option(240, help="Alpha matting foreground threshold"),
-    alpha_matting_background_threshold: int = typer.Option(10, help="Alpha matting background threshold"),
+    model: str = typer.Option(
+        "u2net",
+        help="Model to use for background removal (u2net, u2netp, u2net_human_seg)",
+    ),
+    alpha_matting: bool = typer.Option(
+        False,
+        help="Use alpha matting for better edge detection",
+    ),
+    alpha_matting_foreground_threshold: int = typer.Option(
+        240,
+        help="Alpha matting foreground threshold",
+    ),
+    alpha_matting_background_threshold: int = typer.Option(
+        10,
+        help="Alpha matting background threshold",
+    ),
     alpha_matting_erode_size: int = typer.Option(10, help="Alpha matting erode size"),
     quality: Optional[int] = typer.Option(None, help="Quality for lossy formats (1-100)"),
-    log_level: str = typer.Option("INFO", help="Logging level"),
+    show_logs: Optional[bool] = typer.Option(
+        None, "--show-logs",
+        help="Show detailed logs, by default as set by the global --logging",
+        show_default=False,
+    ),
+    log_level: Optional[LogLevel] = typer.Option(
+        None, "--log-level",
+        help="Log level, by default the global --log-level",
+        case_sensitive=False,
+    ),
 ):
     """
     Remove the background from an image.
@@ -374,14 +648,14 @@ def remove_bg(
     leaving only the main subject. Perfect for product photos or portraits.
     """
     try:
-        setup_logging(show_logs=True, log_level=log_level)
-        logger.debug(f"Removing background from {input_path}")
+        setup_logging(show_logs=show_logs, log_level=log_level)
+        _log().debug(f"Removing background from {input_path}")
 
         from ..core.background import BackgroundRemover
+        from ..utils.validators import validate_image_path
 
-        remover = BackgroundRemover()
-        result = remover.remove_background(
-            str(input_path),
+        input_path = validate_image_path(input_path, should_exist=True)
+        remove_options = dict(
             model_name=model,
             alpha_matting=alpha_matting,
             alpha_matting_foreground_threshold=alpha_matting_foreground_threshold,
@@ -389,23 +663,437 @@ def remove_bg(
             alpha_matting_erode_size=alpha_matting_erode_size,
         )
 
-        # Save the image with the specified quality
-        result.save(
-            str(output_path),
-            quality=quality if quality is not None else 95
+        with BackgroundRemover() as remover:
+            if output_path.suffix.lower() == '.png':
+                # rembg encodes PNG itself, so hand it the raw file and write its
+                # output as-is rather than decoding and re-encoding through PIL
+                result = remover.remove_background(
+                    input_path.read_bytes(), **remove_options
+                )
+                output_path.write_bytes(result)
+            else:
+                result = remover.remove_background(input_path, **remove_options)
+
+                # Save the image with the specified quality
+                result.save(
+                    str(output_path),
+                    quality=quality if quality is not None else 95
+                )
+
+        _emit_ok(
+            "✨ Successfully removed background and saved to: "
+            f"[bold green]{output_path}[/bold green]",
+            expand=True,
+            style="green",
         )
 
-        console.print(
-            Panel(
-                f"✨ Successfully removed background and saved to: [bold green]{output_path}[/bold green]",
-                title="Success",
-                style="green",
+    except Exception as e:
+        _log().error(f"Error removing background: {str(e)}")
+        _emit_err(f"[red]Error:[/red] {str(e)}")
+        raise typer.Exit(1)
+
+
+def _collect_inputs(input_dir: Path, pattern: str) -> List[Path]:
+    """
+    Find the supported images in a directory.
+
+    Parameters
+    ----------
+    input_dir : Path
+        Directory containing input images
+    pattern : str
+        Glob pattern used to select input images
+
+    Returns
+    -------
+    List[Path]
+        Matching image files in sorted order
+
+    Raises
+    ------
+    ValidationError
+        If the directory does not exist or holds no matching images
+    """
+    from ..utils.validators import ValidationError
+
+    if not input_dir.is_dir():
+        raise ValidationError(f"Input directory does not exist: {input_dir}")
+
+    input_paths = sorted(
+        path for path in input_dir.glob(pattern)
+        if path.suffix.lower() in SUPPORTED_FORMATS and path.is_file()
+    )
+    if not input_paths:
+        raise ValidationError(
+            f"No supported images found in {input_dir} matching '{pattern}'"
+        )
+    return input_paths
+
+
+def _check_output_collisions(
+    input_paths: List[Path], output_paths: List[Path]
+) -> None:
+    """
+    Refuse a batch in which two inputs would be written to the same output.
+
+    Raises
+    ------
+    ValidationError
+        If inputs sharing a stem (a.png, a.jpg) map to one output file
+    """
+    from ..utils.validators import ValidationError
+
+    sources: Dict[str, List[str]] = {}
+    for input_path, output_path in zip(input_paths, output_paths):
+        sources.setdefault(os.path.normcase(output_path), []).append(input_path.name)
+    collisions = [names for names in sources.values() if len(names) > 1]
+    if collisions:
+        raise ValidationError(
+            "Images would overwrite each other's output: "
+            + "; ".join(", ".join(names) for names in collisions)
+        )
+
+
+def _report_failures(failures: List[Tuple[Path, str]], total: int) -> None:
+    """
+    Print the images a batch could not process, then fail the batch.
+
+    Raises
+    ------
+    ValidationError
+        If there were any failures
+    """
+    from ..utils.validators import ValidationError
+
+    if not failures:
+        return
+    for input_path, error in sorted(failures):
+        _emit_err(f"[red]Error:[/red] {input_path.name}: {error}")
+    raise ValidationError(f"Failed to process {len(failures)} of {total} images")
+
+
+@app.command()
+def remove_bg_batch(
+    input_dir: Path = typer.Argument(..., help="Directory containing input images"),
+    output_dir: Path = typer.Argument(
+        ...,
+        help="Directory where output images will be saved",
+    ),
+    pattern: str = typer.Option("*", help="Glob pattern used to select input images"),
+    model: str = typer.Option(
+        "u2net",
+        help="Model to use for background removal (u2net, u2netp, u2net_human_seg)",
+    ),
+    alpha_matting: bool = typer.Option(
+        False,
+        help="Use alpha matting for better edge detection",
+    ),
+    alpha_matting_foreground_threshold: int = typer.Option(
+        240,
+        help="Alpha matting foreground threshold",
+    ),
+    alpha_matting_background_threshold: int = typer.Option(
+        10,
+        help="Alpha matting background threshold",
+    ),
+    alpha_matting_erode_size: int = typer.Option(10, help="Alpha matting erode size"),
+    show_logs: Optional[bool] = typer.Option(
+        None, "--show-logs",
+        help="Show detailed logs, by default as set by the global --logging",
+        show_default=False,
+    ),
+    log_level: Optional[LogLevel] = typer.Option(
+        None, "--log-level",
+        help="Log level, by default the global --log-level",
+        case_sensitive=False,
+    ),
+):
+    """
+    Remove the background from every image in a directory.
+
+    The model is loaded once and reused for all matching images, which is
+    much faster than running remove-bg once per file. Results are saved as
+    PNG files to preserve transparency. The batch keeps going when an image
+    fails and reports all failures at the end.
+    """
+    from ..utils.validators import ValidationError
+
+    try:
+        setup_logging(show_logs=show_logs, log_level=log_level)
+        _log().debug(f"Removing backgrounds from {input_dir} ({pattern})")
+
+        from PIL import Image
+        from ..core.background import BackgroundRemover
+        from ..core.base import BaseConverter
+
+        input_paths = _collect_inputs(input_dir, pattern)
+        output_paths = [output_dir / f"{path.stem}.png" for path in input_paths]
+        _check_output_collisions(input_paths, output_paths)
+        if alpha_matting:
+            # Check once up front rather than failing every image the same way
+            BackgroundRemover._validate_alpha_matting(
+                alpha_matting_foreground_threshold,
+                alpha_matting_background_threshold,
+                alpha_matting_erode_size,
             )
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+        save_params = BaseConverter._prepare_save_params(output_dir, suffix='.png')
+
+        remove_options = dict(
+            model_name=model,
+            alpha_matting=alpha_matting,
+            alpha_matting_foreground_threshold=alpha_matting_foreground_threshold,
+            alpha_matting_background_threshold=alpha_matting_background_threshold,
+            alpha_matting_erode_size=alpha_matting_erode_size,
+        )
+
+        failures = []
+        status = f"Removing backgrounds from {len(input_paths)} images..."
+        # The model is loaded by the first image and reused for the rest
+        with BackgroundRemover() as remover, _console().status(status):
+            for input_path, output_path in zip(input_paths, output_paths):
+                try:
+                    with Image.open(input_path) as image:
+                        result = remover.remove_background(image, **remove_options)
+                    BaseConverter._save_image(result, output_path, save_params, '.png')
+                except Exception as e:
+                    failures.append((input_path, str(e)))
+
+        _report_failures(failures, len(input_paths))
+
+        _emit_ok(
+            f"✨ Successfully removed background from {len(input_paths)} images "
+            f"and saved to: [bold green]{output_dir}[/bold green]",
+            expand=True,
+            style="green",
         )
 
     except Exception as e:
-        logger.error(f"Error removing background: {str(e)}")
-        console.print(f"[red]Error:[/red] {str(e)}")
+        _log().error(f"Error removing background: {str(e)}")
+        _emit_err(f"[red]Error:[/red] {str(e)}")
+        raise typer.Exit(1)
+
+
+def _init_worker_logging(log_queue: Any, log_level: str, quiet: bool) -> None:
+    """
+    Send a batch worker's log records to the parent process.
+
+    Spawned workers start with loguru's default stderr sink at DEBUG level.
+    Instead of adding sinks of their own, which would have every worker
+    rotate the same log file, they forward records to the parent through
+    log_queue and the parent's sinks write them. This lives here rather than
+    in oneimage.core so the worker can run it before importing any module
+    that logs.
+    """
+    import multiprocessing
+
+    if multiprocessing.parent_process() is None:
+        # Running in the CLI process itself, whose logging is already set up
+        return
+
+    global _QUIET
+    _QUIET = quiet
+    logger = _log()
+    logger.remove()
+    if quiet:
+        logger.disable("oneimage")
+        return
+
+    def forward(message) -> None:
+        record = message.record
+        text = record["message"]
+        if record["exception"] is not None:
+            import traceback
+
+            text += "\n" + "".join(traceback.format_exception(*record["exception"]))
+        log_queue.put((
+            record["level"].name, text, record["name"], record["function"],
+            record["line"], record["time"],
+        ))
+
+    logger.add(forward, level=log_level, format="{message}", catch=True)
+
+
+def _write_worker_logs(log_queue: Any) -> None:
+    """Write records forwarded by batch workers through this process's sinks."""
+    logger = _log()
+    for level, text, name, function, line, time in iter(log_queue.get, None):
+        fields = dict(name=name, function=function, line=line, time=time)
+        logger.patch(lambda record: record.update(fields)).log(level, "{}", text)
+
+
+@contextmanager
+def _worker_log_queue() -> Iterator[Any]:
+    """Yield a queue for _init_worker_logging, writing its records until exit."""
+    import multiprocessing
+    import threading
+
+    log_queue = multiprocessing.get_context("spawn").Queue()
+    writer = threading.Thread(target=_write_worker_logs, args=(log_queue,), daemon=True)
+    writer.start()
+    try:
+        yield log_queue
+    finally:
+        # Workers have exited by now, so everything they sent is queued
+        log_queue.put(None)
+        writer.join()
+        log_queue.close()
+
+
+def _init_remove_bg_worker(
+    log_queue: Any, log_level: str, quiet: bool, model_name: str
+) -> None:
+    """Set up logging and load the background removal model once per batch worker."""
+    _init_worker_logging(log_queue, log_level, quiet)
+
+    from ..core.background import BackgroundRemover
+
+    BackgroundRemover()._get_session(model_name)
+
+
+@app.command()
+def batch(
+    input_dir: Path = typer.Argument(..., help="Directory containing input images"),
+    output_dir: Path = typer.Argument(
+        ...,
+        help="Directory where output images will be saved",
+    ),
+    op: BatchOperation = typer.Option(
+        BatchOperation.CONVERT, "--op",
+        help="Operation to apply to every image",
+    ),
+    pattern: str = typer.Option("*", help="Glob pattern used to select input images"),
+    output_format: Optional[str] = typer.Option(
+        None, "--format", "-f",
+        help="Output format extension (png, jpg, webp); defaults to the input format",
+    ),
+    width: Optional[int] = typer.Option(
+        None, "--width", "-w",
+        help="Target width in pixels (resize)",
+    ),
+    height: Optional[int] = typer.Option(
+        None, "--height", "-h",
+        help="Target height in pixels (resize)",
+    ),
+    quality: Optional[int] = typer.Option(
+        None, "--quality", "-q",
+        help="Output image quality (1-100)",
+    ),
+    fast: bool = typer.Option(
+        False, "--fast/--no-fast",
+        help="Use fast encoder settings (convert, resize)",
+    ),
+    model: str = typer.Option(
+        "u2net",
+        help="Model to use for background removal (remove-bg)",
+    ),
+    workers: Optional[int] = typer.Option(
+        None, "--workers", "--jobs", "-j",
+        help="Number of parallel workers",
+    ),
+    show_logs: Optional[bool] = typer.Option(
+        None, "--show-logs",
+        help="Show detailed logs, by default as set by the global --logging",
+        show_default=False,
+    ),
+    log_level: Optional[LogLevel] = typer.Option(
+        None, "--log-level",
+        help="Log level, by default the global --log-level",
+        case_sensitive=False,
+    ),
+) -> None:
+    """
+    Apply an operation to every image in a directory in parallel.
+
+    Images are processed in a pool of worker processes, by default one per
+    CPU. The batch keeps going when an image fails and reports all failures
+    at the end. For remove-bg each worker loads the model once, and the
+    output is always PNG.
+    """
+    from rich.progress import Progress
+    from ..utils.validators import ValidationError
+
+    try:
+        setup_logging(show_logs=show_logs, log_level=log_level)
+        _log().debug(f"Starting batch {op.value} on {input_dir} ({pattern})")
+
+        if workers is not None and workers < 1:
+            raise ValidationError(f"Workers must be positive, got {workers}")
+
+        input_paths = _collect_inputs(input_dir, pattern)
+
+        if op is BatchOperation.REMOVE_BG:
+            suffix = '.png'
+        elif output_format:
+            suffix = '.' + output_format.lower().lstrip('.')
+            if suffix not in SUPPORTED_FORMATS:
+                raise ValidationError(
+                    "Unsupported output format. "
+                    f"Supported formats: {SUPPORTED_FORMATS_DISPLAY}"
+                )
+        else:
+            suffix = None
+
+        output_paths = [
+            output_dir / (path.stem + (suffix or path.suffix)) for path in input_paths
+        ]
+
+        _check_output_collisions(input_paths, output_paths)
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        failures = []
+        with _worker_log_queue() as log_queue, Progress(
+            console=_console(), transient=True
+        ) as progress:
+            log_config = (log_queue, _LOGGING_CONFIGURED[1], _QUIET)
+            task = progress.add_task(
+                f"{op.value.capitalize()}...", total=len(input_paths)
+            )
+
+            from ..core.batch import ConvertJob, batch_convert
+
+            jobs = [
+                ConvertJob(
+                    input_path,
+                    output_path,
+                    operation=op.value,
+                    quality=quality,
+                    width=width,
+                    height=height,
+                    fast=fast,
+                    model_name=model,
+                )
+                for input_path, output_path in zip(input_paths, output_paths)
+            ]
+            if op is BatchOperation.REMOVE_BG:
+                initializer, initargs = _init_remove_bg_worker, (*log_config, model)
+            else:
+                initializer, initargs = _init_worker_logging, log_config
+            results = batch_convert(
+                jobs, max_workers=workers, initializer=initializer, initargs=initargs
+            )
+            for result in results:
+                if not result.ok:
+                    failures.append((result.job.input_path, result.error))
+                progress.advance(task)
+
+        _report_failures(failures, len(input_paths))
+
+        _emit_ok(
+            f"[green]Successfully processed[/green] [bold]{len(input_paths)}[/bold] "
+            f"images into [bold]{output_dir}[/bold]"
+        )
+
+    except ValidationError as e:
+        _log().error(str(e))
+        _emit_err(f"[red]Error:[/red] {str(e)}")
+        raise typer.Exit(1)
+
+    except Exception as e:
+        _log().error(f"Unexpected error: {str(e)}")
+        _emit_err(f"[red]Error:[/red] {str(e)}")
         raise typer.Exit(1)
 
 
@@ -1,11 +1,14 @@
 """Configuration settings for OneImage."""
 
-from typing import Final, Set
+from typing import Final, FrozenSet
 
 # Supported image formats (lowercase)
-SUPPORTED_FORMATS: Final[Set[str]] = {
+SUPPORTED_FORMATS: Final[FrozenSet[str]] = frozenset({
     '.jpg', '.jpeg', '.png', '.webp'
-}
+})
+
+# Supported formats as shown in error messages
+SUPPORTED_FORMATS_DISPLAY: Final[str] = ', '.join(sorted(SUPPORTED_FORMATS))
 
 # Maximum file size (100MB)
 MAX_IMAGE_SIZE: Final[int] = 100 * 1024 * 1024
@@ -20,4 +23,4 @@ DEFAULT_QUALITY: Final[int] = 85
 # Logging settings
 DEFAULT_LOG_FORMAT: Final[str] = "{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}"
 DEFAULT_LOG_LEVEL: Final[str] = "INFO"
-DEFAULT_LOG_ROTATION: Final[str] = "1 MB"
+DEFAULT_LOG_ROTATION: Final[str] = "50 MB"
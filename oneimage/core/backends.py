@@ -0,0 +1,132 @@
+"""Optional image processing backends for OneImage."""
+from pathlib import Path
+from typing import Any, Dict, Final, FrozenSet, Optional
+
+from loguru import logger
+
+from oneimage.core.base import _SAVE_PROFILES
+
+# pyvips is optional and only imported the first time a backend is requested
+_PYVIPS: Any = None
+_PYVIPS_CHECKED = False
+
+# Backends resize_image can run on; Pillow is the default
+BACKENDS: Final[FrozenSet[str]] = frozenset({'pillow', 'vips'})
+
+# Pillow save parameters and their libvips equivalents
+_VIPS_SAVE_OPTIONS: Final[Dict[str, str]] = {
+    'quality': 'Q',
+    'compress_level': 'compression',
+    'optimize': 'optimize_coding',
+    'progressive': 'interlace',
+    'method': 'effort',
+}
+
+# Pillow JPEG subsampling values and libvips subsample_mode; 4:2:2 has none
+_VIPS_SUBSAMPLE_MODES: Final[Dict[int, str]] = {0: 'off', 2: 'on'}
+
+
+def _import_pyvips() -> Any:
+    """Return the pyvips module, or None if it or libvips is not installed."""
+    global _PYVIPS, _PYVIPS_CHECKED
+    if not _PYVIPS_CHECKED:
+        _PYVIPS_CHECKED = True
+        try:
+            import pyvips
+            _PYVIPS = pyvips
+        except (ImportError, OSError) as e:
+            # OSError is raised when pyvips is installed but libvips is not
+            logger.debug("pyvips backend unavailable: {}", e)
+    return _PYVIPS
+
+
+class VipsBackend:
+    """Resize images with libvips, which streams decode, shrink and encode."""
+
+    # Output suffixes the backend writes
+    SUFFIXES: Final[FrozenSet[str]] = frozenset({'.jpg', '.jpeg', '.png', '.webp'})
+
+    @staticmethod
+    def available() -> bool:
+        """
+        Check whether pyvips and libvips are installed.
+
+        Returns
+        -------
+        bool
+            True if the backend can be used
+        """
+        return _import_pyvips() is not None
+
+    @staticmethod
+    def save_options(suffix: str, save_params: dict) -> Optional[dict]:
+        """
+        Translate Pillow save parameters to libvips save options.
+
+        Parameters
+        ----------
+        suffix : str
+            Lowercase output suffix
+        save_params : dict
+            Pillow save parameters from BaseConverter._prepare_save_params
+
+        Returns
+        -------
+        Optional[dict]
+            libvips save options, or None if the backend cannot write the
+            suffix or a parameter has no libvips equivalent
+        """
+        if suffix not in VipsBackend.SUFFIXES:
+            return None
+        options = {}
+        for key, value in save_params.items():
+            if key == 'subsampling' and value in _VIPS_SUBSAMPLE_MODES:
+                options['subsample_mode'] = _VIPS_SUBSAMPLE_MODES[value]
+            elif key in _VIPS_SAVE_OPTIONS:
+                options[_VIPS_SAVE_OPTIONS[key]] = value
+            else:
+                return None
+        return options
+
+    @staticmethod
+    def resize(
+        input_path: Path,
+        output_path: Path,
+        width: int,
+        height: int,
+        suffix: str,
+        options: dict,
+    ) -> None:
+        """
+        Resize an image to exact dimensions and save it.
+
+        libvips shrinks JPEGs while decoding, so results are not pixel-exact
+        with Pillow's.
+
+        Parameters
+        ----------
+        input_path : Path
+            Path to input image file
+        output_path : Path
+            Path where resized image will be saved
+        width : int
+            Target width in pixels
+        height : int
+            Target height in pixels
+        suffix : str
+            Lowercase output suffix
+        options : dict
+            libvips save options from save_options
+        """
+        pyvips = _import_pyvips()
+
+        # no_rotate keeps EXIF orientation untouched, as Pillow does
+        image = pyvips.Image.thumbnail(
+            str(input_path), width, height=height, size='force', no_rotate=True
+        )
+
+        # Drop alpha for JPEG output, like Image.convert('RGB')
+        if _SAVE_PROFILES[suffix].needs_rgb and image.hasalpha():
+            image = image.extract_band(0, n=image.bands - 1)
+
+        image.write_to_file(str(output_path), **options)
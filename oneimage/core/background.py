@@ -1,45 +1,187 @@
 """Background removal functionality for OneImage."""
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 import os
+import threading
 
 from PIL import Image
-from rembg import remove, new_session
 from loguru import logger
 
 from oneimage.utils.validators import validate_image_path, ValidationError
 
+# Sessions are shared by every BackgroundRemover in the process, so each model
+# is only loaded once no matter how many images or removers are involved.
+_SESSION_CACHE: Dict[str, Any] = {}
+
+# Number of open removers using each cached session; close() drops a
+# session once its last user is closed
+_SESSION_USERS: Dict[str, int] = {}
+
+# Serializes session creation and use counts, so concurrent callers load a
+# model only once
+_SESSION_LOCK = threading.Lock()
+
+# ONNX Runtime execution providers in order of preference. CPU always comes
+# last so operators an accelerator can't run still have somewhere to go.
+_PREFERRED_PROVIDERS: Tuple[str, ...] = (
+    "CUDAExecutionProvider",
+    "ROCMExecutionProvider",
+    "CoreMLExecutionProvider",
+    "DmlExecutionProvider",
+    "OpenVINOExecutionProvider",
+)
+
+# (name, minimum, maximum) of each alpha matting parameter; None is unbounded
+_AM_RANGES: Tuple[Tuple[str, int, Optional[int]], ...] = (
+    ("foreground threshold", 0, 255),
+    ("background threshold", 0, 255),
+    ("erode size", 0, None),
+)
+
+
+def new_session(*args: Any, **kwargs: Any) -> Any:
+    """Create a rembg session; rembg and onnxruntime are imported on first use."""
+    from rembg import new_session as rembg_new_session
+    return rembg_new_session(*args, **kwargs)
+
+
+@lru_cache(maxsize=1)
+def _session_providers() -> Optional[List[str]]:
+    """
+    Get the execution providers to run models with.
+
+    Returns
+    -------
+    Optional[List[str]]
+        Available accelerators in order of preference followed by the CPU,
+        or None to let rembg choose when only the CPU is available
+    """
+    import onnxruntime
+
+    available = set(onnxruntime.get_available_providers())
+    accelerators = [
+        provider for provider in _PREFERRED_PROVIDERS if provider in available
+    ]
+    if not accelerators:
+        return None
+    logger.debug("Running background removal models on {}", accelerators[0])
+    return accelerators + ["CPUExecutionProvider"]
+
+
+def remove(*args: Any, **kwargs: Any) -> Any:
+    """Run rembg.remove; rembg and onnxruntime are imported on first use."""
+    from rembg import remove as rembg_remove
+    return rembg_remove(*args, **kwargs)
+
 
 class BackgroundRemover:
     """Handles background removal operations using rembg."""
 
     def __init__(self):
         """Initialize the BackgroundRemover."""
-        self._sessions = {}
+        self._sessions = _SESSION_CACHE
+        # Models whose shared session this remover holds a use of
+        self._models: Set[str] = set()
 
     def _get_session(self, model_name: str):
         """Get or create a session for the specified model."""
-        if model_name not in self._sessions:
-            self._sessions[model_name] = new_session(model_name)
-        return self._sessions[model_name]
+        session = self._sessions.get(model_name)
+        if session is None or model_name not in self._models:
+            with _SESSION_LOCK:
+                session = self._sessions.get(model_name)
+                if session is None:
+                    providers = _session_providers()
+                    if providers is None:
+                        session = new_session(model_name)
+                    else:
+                        session = new_session(model_name, providers=providers)
+                    self._sessions[model_name] = session
+                    _SESSION_USERS[model_name] = 0
+                if model_name not in self._models:
+                    self._models.add(model_name)
+                    _SESSION_USERS[model_name] = _SESSION_USERS.get(model_name, 0) + 1
+        return session
+
+    def close(self) -> None:
+        """
+        Release the model sessions this remover used.
+
+        Sessions are shared between removers, so a session is only freed once
+        every remover using it has been closed. Removers that are never closed
+        keep their sessions loaded for the life of the process.
+        """
+        if not self._models:
+            return
+        released = 0
+        with _SESSION_LOCK:
+            for model_name in self._models:
+                users = _SESSION_USERS.get(model_name, 0) - 1
+                if users > 0:
+                    _SESSION_USERS[model_name] = users
+                    continue
+                _SESSION_USERS.pop(model_name, None)
+                if self._sessions.pop(model_name, None) is not None:
+                    released += 1
+            self._models.clear()
+        if not released:
+            return
+        logger.debug("Releasing {} background removal session(s)", released)
+        # ONNX sessions hold large native buffers, reclaim them right away
+        import gc
+        gc.collect()
+
+    def __enter__(self) -> "BackgroundRemover":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @staticmethod
+    def _validate_alpha_matting(
+        foreground_threshold: int,
+        background_threshold: int,
+        erode_size: int,
+    ) -> None:
+        """
+        Validate alpha matting parameters.
+
+        Raises
+        ------
+        ValidationError
+            If any parameter is out of range
+        """
+        values = (foreground_threshold, background_threshold, erode_size)
+        for (name, low, high), value in zip(_AM_RANGES, values):
+            if low <= value and (high is None or value <= high):
+                continue
+            # Only build the message once a check has failed
+            if high is None:
+                raise ValidationError(
+                    f"Alpha matting {name} must be non-negative, got {value}"
+                )
+            raise ValidationError(
+                f"Alpha matting {name} must be between {low} and {high}, got {value}"
+            )
 
     def remove_background(
         self,
-        input_path: Union[str, Path],
+        input_path: Union[str, Path, Image.Image, bytes],
         model_name: str = "u2net",
         alpha_matting: bool = False,
         alpha_matting_foreground_threshold: int = 240,
         alpha_matting_background_threshold: int = 10,
         alpha_matting_erode_size: int = 10,
-    ) -> Image.Image:
+    ) -> Union[Image.Image, bytes]:
         """
         Remove the background from an image.
 
         Parameters
         ----------
-        input_path : Union[str, Path]
-            Path to input image file
+        input_path : Union[str, Path, Image.Image, bytes]
+            Path to input image file, an already loaded image, or the encoded
+            contents of an image file
         model_name : str, optional
             Name of the model to use (u2net, u2netp, u2net_human_seg)
         alpha_matting : bool, optional
@@ -53,8 +195,9 @@ class BackgroundRemover:
 
         Returns
         -------
-        PIL.Image.Image
-            Image with background removed
+        Union[PIL.Image.Image, bytes]
+            Image with background removed. Encoded input yields PNG encoded
+            bytes, so they can be written out without another encode.
 
         Raises
         ------
@@ -62,26 +205,24 @@ class BackgroundRemover:
             If any validation fails
         """
         try:
-            # Validate input path
-            input_path = validate_image_path(input_path, should_exist=True)
+            if isinstance(input_path, (bytes, Image.Image)):
+                # rembg decodes bytes itself; images are already loaded
+                input_image = input_path
+            else:
+                # Validate input path
+                input_image = validate_image_path(input_path, should_exist=True)
 
             # Validate alpha matting parameters
             if alpha_matting:
-                if not 0 <= alpha_matting_foreground_threshold <= 255:
-                    raise ValidationError(
-                        f"Alpha matting foreground threshold must be between 0 and 255, got {alpha_matting_foreground_threshold}"
-                    )
-                if not 0 <= alpha_matting_background_threshold <= 255:
-                    raise ValidationError(
-                        f"Alpha matting background threshold must be between 0 and 255, got {alpha_matting_background_threshold}"
-                    )
-                if alpha_matting_erode_size < 0:
-                    raise ValidationError(
-                        f"Alpha matting erode size must be non-negative, got {alpha_matting_erode_size}"
-                    )
+                self._validate_alpha_matting(
+                    alpha_matting_foreground_threshold,
+                    alpha_matting_background_threshold,
+                    alpha_matting_erode_size,
+                )
 
             # Load the image
-            input_image = Image.open(input_path)
+            if isinstance(input_image, Path):
+                input_image = Image.open(input_image)
 
             # Get the session for the specified model
             session = self._get_session(model_name)
@@ -101,3 +242,70 @@ class BackgroundRemover:
         except Exception as e:
             logger.error(f"Error removing background: {str(e)}")
             raise
+
+    def remove_background_batch(
+        self,
+        input_paths: Iterable[Union[str, Path]],
+        model_name: str = "u2net",
+        alpha_matting: bool = False,
+        alpha_matting_foreground_threshold: int = 240,
+        alpha_matting_background_threshold: int = 10,
+        alpha_matting_erode_size: int = 10,
+    ) -> Iterator[Tuple[Path, Image.Image]]:
+        """
+        Remove the background from several images using a single model session.
+
+        Parameters
+        ----------
+        input_paths : Iterable[Union[str, Path]]
+            Paths to input image files
+        model_name : str, optional
+            Name of the model to use (u2net, u2netp, u2net_human_seg)
+        alpha_matting : bool, optional
+            Whether to use alpha matting for better edge detection
+        alpha_matting_foreground_threshold : int, optional
+            Alpha matting foreground threshold (0-255)
+        alpha_matting_background_threshold : int, optional
+            Alpha matting background threshold (0-255)
+        alpha_matting_erode_size : int, optional
+            Alpha matting erode size
+
+        Yields
+        ------
+        Tuple[Path, PIL.Image.Image]
+            Validated input path and the image with its background removed
+
+        Raises
+        ------
+        ValidationError
+            If any validation fails
+        """
+        try:
+            if alpha_matting:
+                self._validate_alpha_matting(
+                    alpha_matting_foreground_threshold,
+                    alpha_matting_background_threshold,
+                    alpha_matting_erode_size,
+                )
+
+            # Load the model once for the whole batch
+            remove_options = dict(
+                session=self._get_session(model_name),
+                alpha_matting=alpha_matting,
+                alpha_matting_foreground_threshold=alpha_matting_foreground_threshold,
+                alpha_matting_background_threshold=alpha_matting_background_threshold,
+                alpha_matting_erode_size=alpha_matting_erode_size,
+            )
+
+            for input_path in input_paths:
+                input_path = validate_image_path(input_path, should_exist=True)
+                logger.debug("Removing background from {}", input_path)
+
+                with Image.open(input_path) as input_image:
+                    output_image = remove(input_image, **remove_options)
+
+                yield input_path, output_image
+
+        except Exception as e:
+            logger.error(f"Error removing background: {str(e)}")
+            raise
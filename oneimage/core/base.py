@@ -1,19 +1,162 @@
 """Base converter module for OneImage."""
+import os
+import sys
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Final, Optional, Tuple, Union
 
-from PIL import Image
 from loguru import logger
 
-from oneimage.utils.validators import validate_image_path, validate_quality
+from oneimage.config.settings import SUPPORTED_FORMATS, SUPPORTED_FORMATS_DISPLAY
+from oneimage.utils.validators import (
+    ValidationError, validate_image_path, validate_quality
+)
+
+if TYPE_CHECKING:
+    from PIL import Image
 
 DEFAULT_QUALITY = 85
 
+# zlib level used for PNG output in fast mode
+FAST_PNG_COMPRESS_LEVEL: Final[int] = 1
+
+# Write buffer for saved images, so large outputs go out in few syscalls
+SAVE_BUFFER_SIZE: Final[int] = 4 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class SaveProfile:
+    """
+    How images are saved for one output format.
+
+    Parameters
+    ----------
+    format : str
+        Pillow format name
+    needs_rgb : bool, optional
+        Whether the format cannot store an alpha channel, by default False
+    lossy : bool, optional
+        Whether the format takes a quality setting, by default False
+    compressible : bool, optional
+        Whether the format takes a zlib compress_level, by default False
+    fast_params : Tuple[Tuple[str, Any], ...], optional
+        Save parameters that favor encoding speed over output size
+    """
+    format: str
+    needs_rgb: bool = False
+    lossy: bool = False
+    compressible: bool = False
+    fast_params: Tuple[Tuple[str, Any], ...] = ()
+
+    def build(
+        self,
+        quality: Optional[int] = None,
+        fast: bool = False,
+        compress_level: Optional[int] = None,
+    ) -> dict:
+        """Build Pillow save parameters; see BaseConverter._prepare_save_params."""
+        save_params = {}
+        if self.lossy:
+            save_params['quality'] = quality or DEFAULT_QUALITY
+        if fast:
+            save_params.update(self.fast_params)
+        if self.compressible and compress_level is not None:
+            save_params['compress_level'] = compress_level
+        return save_params
+
+
+_JPEG_PROFILE = SaveProfile(
+    'JPEG',
+    needs_rgb=True,
+    lossy=True,
+    fast_params=(('optimize', False), ('progressive', False), ('subsampling', 2)),
+)
+
+# Save profile for each supported output suffix
+_SAVE_PROFILES: Final[Dict[str, SaveProfile]] = {
+    '.jpg': _JPEG_PROFILE,
+    '.jpeg': _JPEG_PROFILE,
+    '.png': SaveProfile(
+        'PNG',
+        compressible=True,
+        fast_params=(('compress_level', FAST_PNG_COMPRESS_LEVEL),),
+    ),
+    # method=0 is the lowest WebP encoder effort
+    '.webp': SaveProfile('WEBP', lossy=True, fast_params=(('method', 0),)),
+}
+
+# Profile for suffixes without one: no extra save parameters
+_DEFAULT_PROFILE = SaveProfile('')
+
+
 class BaseConverter:
     """Base class for image operations."""
 
     @staticmethod
-    def _prepare_save_params(output_path: Path, quality: Optional[int] = None) -> dict:
+    def _output_suffix(output_path: Union[str, Path]) -> str:
+        """
+        Get the lowercase, interned suffix of an output path.
+
+        Parameters
+        ----------
+        output_path : Union[str, Path]
+            Path where image will be saved
+
+        Returns
+        -------
+        str
+            Lowercase suffix including the leading dot
+        """
+        # splitext on the plain string avoids building a Path per call
+        return sys.intern(os.path.splitext(os.fspath(output_path))[1].lower())
+
+    @staticmethod
+    def _validate_output(
+        output_path: Union[str, Path, BinaryIO],
+        suffix: Optional[str] = None,
+    ) -> Union[Path, BinaryIO]:
+        """
+        Validate an output path, or the suffix given for an output file object.
+
+        Parameters
+        ----------
+        output_path : Union[str, Path, BinaryIO]
+            Path where image will be saved, or a binary file object
+        suffix : Optional[str], optional
+            Lowercase output suffix; required when output_path is a file object
+
+        Returns
+        -------
+        Union[Path, BinaryIO]
+            Validated path, or the file object unchanged
+
+        Raises
+        ------
+        ValidationError
+            If the path is invalid, or a file object has no supported suffix
+        """
+        if not hasattr(output_path, 'write'):
+            return validate_image_path(output_path, should_exist=False)
+        # A file object has no name to take the format from
+        if not suffix:
+            raise ValidationError(
+                "An output suffix is required when writing to a file object"
+            )
+        if suffix not in SUPPORTED_FORMATS:
+            raise ValidationError(
+                f"Unsupported output format '{suffix[1:]}'. "
+                f"Supported formats: {SUPPORTED_FORMATS_DISPLAY}"
+            )
+        return output_path
+
+    @staticmethod
+    def _prepare_save_params(
+        output_path: Path,
+        quality: Optional[int] = None,
+        suffix: Optional[str] = None,
+        fast: bool = False,
+        compress_level: Optional[int] = None,
+    ) -> dict:
         """
         Prepare save parameters for image output.
 
@@ -23,19 +166,29 @@ class BaseConverter:
             Path where image will be saved
         quality : Optional[int]
             Quality setting for lossy formats (1-100)
+        suffix : Optional[str], optional
+            Precomputed output suffix, by default derived from output_path
+        fast : bool, optional
+            Favor encoding speed over output size, by default False
+        compress_level : Optional[int], optional
+            PNG zlib compression level (0-9), overrides the fast preset
 
         Returns
         -------
         dict
             Dictionary of save parameters
         """
-        save_params = {}
-        if output_path.suffix.lower() in ['.jpg', '.jpeg', '.webp']:
-            save_params['quality'] = quality or DEFAULT_QUALITY
-        return save_params
+        if suffix is None:
+            suffix = BaseConverter._output_suffix(output_path)
+        profile = _SAVE_PROFILES.get(suffix, _DEFAULT_PROFILE)
+        return profile.build(quality, fast=fast, compress_level=compress_level)
 
     @staticmethod
-    def _handle_rgba_to_rgb(img: Image.Image, output_path: Path) -> Image.Image:
+    def _handle_rgba_to_rgb(
+        img: "Image.Image",
+        output_path: Path,
+        suffix: Optional[str] = None,
+    ) -> "Image.Image":
         """
         Convert RGBA to RGB if saving as JPEG.
 
@@ -45,13 +198,63 @@ class BaseConverter:
             Input image
         output_path : Path
             Output path to determine format
+        suffix : Optional[str], optional
+            Precomputed output suffix, by default derived from output_path
 
         Returns
         -------
         Image.Image
             Converted image if needed, otherwise original image
         """
-        if output_path.suffix.lower() in ['.jpg', '.jpeg'] and img.mode == 'RGBA':
+        if suffix is None:
+            suffix = BaseConverter._output_suffix(output_path)
+        profile = _SAVE_PROFILES.get(suffix, _DEFAULT_PROFILE)
+        if img.mode == 'RGBA' and profile.needs_rgb:
             logger.debug("Converting RGBA to RGB for JPEG output")
             return img.convert('RGB')
         return img
+
+    @staticmethod
+    def _save_image(
+        img: "Image.Image",
+        output_path: Union[Path, BinaryIO],
+        save_params: dict,
+        suffix: Optional[str] = None,
+    ) -> None:
+        """
+        Save an image through a large write buffer.
+
+        The format is taken from the suffix so Pillow does not have to look
+        it up from the file name. A partially written file is removed if
+        saving fails. File objects are written to directly.
+
+        Parameters
+        ----------
+        img : Image.Image
+            Image to save
+        output_path : Union[Path, BinaryIO]
+            Path where image will be saved, or a binary file object
+        save_params : dict
+            Save parameters from _prepare_save_params
+        suffix : Optional[str], optional
+            Precomputed output suffix, by default derived from output_path
+        """
+        if suffix is None:
+            suffix = BaseConverter._output_suffix(output_path)
+        format_name = _SAVE_PROFILES.get(suffix, _DEFAULT_PROFILE).format or None
+        if hasattr(output_path, 'write'):
+            img.save(output_path, format=format_name, **save_params)
+            return
+        # Decode before the output is truncated, in case it is also the input
+        img.load()
+        created = not os.path.exists(output_path)
+        try:
+            with open(output_path, 'wb', buffering=SAVE_BUFFER_SIZE) as fp:
+                img.save(fp, format=format_name, **save_params)
+        except Exception:
+            if created:
+                try:
+                    os.remove(output_path)
+                except OSError:
+                    pass
+            raise
@@ -0,0 +1,177 @@
+"""Parallel batch conversion for OneImage."""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Final, FrozenSet, Iterable, Iterator, Optional, Tuple
+
+from loguru import logger
+
+from oneimage.core.converter import ImageConverter
+from oneimage.utils.validators import ValidationError
+
+# Operations a ConvertJob can run
+OPERATIONS: Final[FrozenSet[str]] = frozenset({"convert", "resize", "remove-bg"})
+
+
+@dataclass(frozen=True)
+class ConvertJob:
+    """
+    A single conversion, resize or background removal of one image.
+
+    Parameters
+    ----------
+    input_path : Path
+        Path to input image file
+    output_path : Path
+        Path where the output image will be saved
+    operation : str, optional
+        One of "convert", "resize" or "remove-bg", by default "convert"
+    quality : Optional[int], optional
+        Quality setting for lossy formats (1-100)
+    width : Optional[int], optional
+        Target width in pixels (resize)
+    height : Optional[int], optional
+        Target height in pixels (resize)
+    maintain_aspect_ratio : bool, optional
+        Whether to keep the aspect ratio when resizing, by default True
+    fast : bool, optional
+        Use fast encoder presets, by default False
+    compress_level : Optional[int], optional
+        PNG zlib compression level (0-9)
+    model_name : str, optional
+        Background removal model (remove-bg), by default "u2net". The
+        output is always PNG encoded, whatever its suffix.
+    """
+    input_path: Path
+    output_path: Path
+    operation: str = "convert"
+    quality: Optional[int] = None
+    width: Optional[int] = None
+    height: Optional[int] = None
+    maintain_aspect_ratio: bool = True
+    fast: bool = False
+    compress_level: Optional[int] = None
+    model_name: str = "u2net"
+
+
+@dataclass(frozen=True)
+class JobResult:
+    """Outcome of a ConvertJob; error is None if it succeeded."""
+    job: ConvertJob
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the job succeeded."""
+        return self.error is None
+
+
+def run_job(job: ConvertJob) -> None:
+    """
+    Run a single job in the current process.
+
+    Parameters
+    ----------
+    job : ConvertJob
+        Job to run
+
+    Raises
+    ------
+    ValidationError
+        If the job is invalid or fails
+    """
+    if job.operation == "resize":
+        ImageConverter.resize_image(
+            job.input_path,
+            job.output_path,
+            width=job.width,
+            height=job.height,
+            maintain_aspect_ratio=job.maintain_aspect_ratio,
+            quality=job.quality,
+            fast=job.fast,
+            compress_level=job.compress_level,
+        )
+    elif job.operation == "convert":
+        ImageConverter.convert_image(
+            job.input_path,
+            job.output_path,
+            job.quality,
+            fast=job.fast,
+            compress_level=job.compress_level,
+        )
+    elif job.operation == "remove-bg":
+        from oneimage.core.background import BackgroundRemover
+
+        # Encoded input comes back PNG encoded, so it is written as-is
+        result = BackgroundRemover().remove_background(
+            job.input_path.read_bytes(), model_name=job.model_name
+        )
+        job.output_path.write_bytes(result)
+    else:
+        raise ValidationError(
+            f"Unknown operation '{job.operation}'. "
+            f"Supported operations: {', '.join(sorted(OPERATIONS))}"
+        )
+
+
+def batch_convert(
+    jobs: Iterable[ConvertJob],
+    max_workers: Optional[int] = None,
+    initializer: Optional[Callable[..., Any]] = None,
+    initargs: Tuple[Any, ...] = (),
+) -> Iterator[JobResult]:
+    """
+    Run jobs in parallel across a process pool.
+
+    Results are yielded as jobs finish, not in submission order. A failing job
+    is reported through its result and does not stop the others.
+
+    Parameters
+    ----------
+    jobs : Iterable[ConvertJob]
+        Jobs to run
+    max_workers : Optional[int], optional
+        Number of worker processes, by default os.cpu_count()
+    initializer : Optional[Callable[..., Any]], optional
+        Called with initargs in each worker before it runs any job, e.g. to
+        configure logging. Spawned workers start with loguru's default
+        stderr sink, so callers that configure logging should pass one.
+    initargs : Tuple[Any, ...], optional
+        Arguments for initializer
+
+    Yields
+    ------
+    JobResult
+        Outcome of each job
+    """
+    jobs = list(jobs)
+    if not jobs:
+        return
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    # Don't start more workers than there are jobs
+    max_workers = min(max_workers, len(jobs))
+    logger.debug("Running {} jobs on {} worker(s)", len(jobs), max_workers)
+
+    # Workers are spawned rather than forked: forking after libvips or any
+    # other native library has started its threads can deadlock the children
+    context = multiprocessing.get_context("spawn")
+    executor = ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=context,
+        initializer=initializer,
+        initargs=initargs,
+    )
+    with executor:
+        futures = {executor.submit(run_job, job): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"Error processing {job.input_path}: {str(e)}")
+                yield JobResult(job, str(e))
+            else:
+                yield JobResult(job)
@@ -1,12 +1,17 @@
 """Image converter module for OneImage."""
+import shutil
+import sys
 from pathlib import Path
-from typing import Optional, Union, Tuple
+from typing import Any, BinaryIO, Dict, Optional, Union, Tuple
 
-from PIL import Image
 from loguru import logger
 
 from oneimage.utils.validators import validate_image_path, validate_quality, ValidationError
-from oneimage.core.base import BaseConverter, DEFAULT_QUALITY
+from oneimage.core.backends import BACKENDS, VipsBackend
+from oneimage.core.base import BaseConverter, DEFAULT_QUALITY, _SAVE_PROFILES
+
+# How close box reduction may get to the target size before LANCZOS takes over
+REDUCING_GAP = 3.0
 
 class ImageConverter(BaseConverter):
     """Handles image conversion and transformation operations."""
@@ -14,8 +19,11 @@ class ImageConverter(BaseConverter):
     @staticmethod
     def convert_image(
         input_path: Union[str, Path],
-        output_path: Union[str, Path],
+        output_path: Union[str, Path, BinaryIO],
         quality: Optional[Union[int, str]] = None,
+        suffix: Optional[str] = None,
+        fast: bool = False,
+        compress_level: Optional[int] = None,
     ) -> None:
         """
         Convert an image from one format to another.
@@ -24,10 +32,24 @@ class ImageConverter(BaseConverter):
         ----------
         input_path : Union[str, Path]
             Path to input image file
-        output_path : Union[str, Path]
-            Path where converted image will be saved
+        output_path : Union[str, Path, BinaryIO]
+            Path where converted image will be saved, or a binary file
+            object (such as io.BytesIO) to write it to
         quality : Optional[Union[int, str]], optional
             Quality setting for lossy formats (1-100), by default None
+        suffix : Optional[str], optional
+            Lowercase output suffix if already known, by default derived
+            from output_path; required when output_path is a file object
+        fast : bool, optional
+            Use fast encoder presets at the cost of larger files, by default False
+        compress_level : Optional[int], optional
+            PNG zlib compression level (0-9), by default Pillow's
+
+        Notes
+        -----
+        When the input is already in the output format and no encoder
+        options are given, the file is copied as-is instead of being
+        decoded and re-encoded.
 
         Raises
         ------
@@ -40,41 +62,65 @@ class ImageConverter(BaseConverter):
 
             # Validate input path
             input_path = validate_image_path(input_path, should_exist=True)
-            logger.debug(f"Input path validated: {input_path}")
+            logger.debug("Input path validated: {}", input_path)
 
-            # Validate output path
-            output_path = validate_image_path(output_path, should_exist=False)
-            logger.debug(f"Output path validated: {output_path}")
+            # Validate output path; a file object only needs a known format
+            to_stream = hasattr(output_path, 'write')
+            output_path = ImageConverter._validate_output(output_path, suffix)
+            logger.debug("Output path validated: {}", output_path)
 
             # Validate quality
             quality_value = validate_quality(quality) or DEFAULT_QUALITY
-            logger.debug(f"Quality validated: {quality_value}")
+            logger.debug("Quality validated: {}", quality_value)
 
             # Open and convert image
             logger.debug("Opening input image")
+            from PIL import Image
+
             with Image.open(input_path) as img:
                 # Get original format and mode
                 original_format = img.format
                 original_mode = img.mode
-                logger.debug(f"Image opened: format={original_format}, mode={original_mode}")
+                logger.debug(
+                    "Image opened: format={}, mode={}", original_format, original_mode
+                )
+
+                if suffix:
+                    out_ext = sys.intern(suffix)
+                else:
+                    out_ext = ImageConverter._output_suffix(output_path)
+
+                # Nothing to convert: copy the encoded file instead of re-encoding it
+                reencode = quality is not None or fast or compress_level is not None
+                profile = _SAVE_PROFILES.get(out_ext)
+                same_format = profile is not None and profile.format == original_format
+                if not reencode and same_format:
+                    if to_stream:
+                        with open(input_path, 'rb') as src:
+                            shutil.copyfileobj(src, output_path)
+                    elif input_path != output_path:
+                        shutil.copyfile(input_path, output_path)
+                    logger.info(
+                        f"Input is already {original_format}, "
+                        f"copied {input_path} to {output_path}"
+                    )
+                    return
 
                 # Convert RGBA to RGB if saving as JPEG
-                out_ext = output_path.suffix.lower()
-                if out_ext in ['.jpg', '.jpeg'] and img.mode == 'RGBA':
-                    logger.debug("Converting RGBA to RGB for JPEG output")
-                    img = img.convert('RGB')
+                img = ImageConverter._handle_rgba_to_rgb(img, output_path, out_ext)
 
                 # Prepare save parameters
-                save_params = {}
-
-                # Add quality parameter for supported formats
-                if out_ext in ['.jpg', '.jpeg', '.webp']:
-                    save_params['quality'] = quality_value
-                    logger.debug(f"Using quality: {quality_value}")
+                save_params = ImageConverter._prepare_save_params(
+                    output_path,
+                    quality_value,
+                    out_ext,
+                    fast=fast,
+                    compress_level=compress_level,
+                )
 
                 # Save with appropriate parameters
-                logger.debug(f"Saving image with parameters: {save_params}")
-                img.save(output_path, **save_params)
+                logger.debug("Saving image with parameters: {}", save_params)
+                ImageConverter._save_image(img, output_path, save_params, out_ext)
 
             logger.info(f"Successfully converted {input_path} to {output_path}")
 
@@ -93,6 +139,10 @@ class ImageConverter(BaseConverter):
         height: Optional[int] = None,
         maintain_aspect_ratio: bool = True,
         quality: Optional[Union[int, str]] = None,
+        fast: bool = False,
+        compress_level: Optional[int] = None,
+        draft: bool = True,
+        backend: str = 'pillow',
     ) -> None:
         """
         Resize an image to specified dimensions.
@@ -111,6 +161,19 @@ class ImageConverter(BaseConverter):
             If True, maintains aspect ratio when resizing
         quality : Optional[Union[int, str]]
             Quality setting for lossy formats (1-100)
+        fast : bool, optional
+            Use fast encoder presets at the cost of larger files, and let the
+            JPEG decoder scale straight to the target size, by default False
+        compress_level : Optional[int], optional
+            PNG zlib compression level (0-9), by default Pillow's
+        draft : bool, optional
+            Let the JPEG decoder downscale while decoding when shrinking, by
+            default True. Disable for pixel-exact resizes.
+        backend : str, optional
+            'pillow' (the default) or 'vips', which streams large images
+            through libvips and needs pyvips. The vips backend falls back to
+            Pillow when draft is off or a save setting has no libvips
+            equivalent, so no requested setting is silently dropped.
 
         Raises
         ------
@@ -127,6 +190,14 @@ class ImageConverter(BaseConverter):
             # Validate quality
             quality_value = validate_quality(quality) or DEFAULT_QUALITY
 
+            if backend not in BACKENDS:
+                raise ValidationError(
+                    f"Unknown backend '{backend}'. "
+                    f"Supported backends: {', '.join(sorted(BACKENDS))}"
+                )
+            if backend == 'vips' and not VipsBackend.available():
+                raise ValidationError("The vips backend requires pyvips and libvips")
+
             # Validate dimensions
             if not width and not height:
                 raise ValidationError("At least one of width or height must be specified")
@@ -135,12 +206,17 @@ class ImageConverter(BaseConverter):
             if height and height <= 0:
                 raise ValidationError(f"Height must be positive, got {height}")
 
-            logger.debug(f"Resizing with params: width={width}, height={height}, maintain_aspect_ratio={maintain_aspect_ratio}")
+            logger.debug(
+                "Resizing with params: width={}, height={}, maintain_aspect_ratio={}",
+                width, height, maintain_aspect_ratio
+            )
 
             # Open and resize image
+            from PIL import Image
+
             with Image.open(input_path) as img:
                 original_width, original_height = img.size
-                logger.debug(f"Original size: {original_width}x{original_height}")
+                logger.debug("Original size: {}x{}", original_width, original_height)
 
                 # Calculate new dimensions
                 if maintain_aspect_ratio:
@@ -165,23 +241,68 @@ class ImageConverter(BaseConverter):
                     width = width or original_width
                     height = height or original_height
 
-                logger.debug(f"New size: {width}x{height}")
-
-                # Convert RGBA to RGB if saving as JPEG
-                if output_path.suffix.lower() in ['.jpg', '.jpeg'] and img.mode == 'RGBA':
-                    logger.debug("Converting RGBA to RGB for JPEG output")
-                    img = img.convert('RGB')
-
-                # Perform resize
-                resized_img = img.resize((width, height), Image.Resampling.LANCZOS)
+                logger.debug("New size: {}x{}", width, height)
 
                 # Prepare save parameters
-                save_params = {}
-                if output_path.suffix.lower() in ['.jpg', '.jpeg', '.webp']:
-                    save_params['quality'] = quality_value
+                out_ext = ImageConverter._output_suffix(output_path)
+                save_params = ImageConverter._prepare_save_params(
+                    output_path,
+                    quality_value,
+                    out_ext,
+                    fast=fast,
+                    compress_level=compress_level,
+                )
+
+                vips_options = None
+                if backend == 'vips' and draft:
+                    vips_options = VipsBackend.save_options(out_ext, save_params)
+                    if vips_options is None:
+                        logger.debug(
+                            "Settings have no libvips equivalent, using Pillow"
+                        )
+
+                if vips_options is not None:
+                    # Only the header has been read so far, let libvips do the rest
+                    logger.debug("Resizing with the libvips backend")
+                    VipsBackend.resize(
+                        input_path, output_path, width, height, out_ext, vips_options
+                    )
+                else:
+                    if draft and img.format == 'JPEG':
+                        if fast:
+                            # Decode at the smallest 1/2, 1/4 or 1/8 scale that
+                            # still covers the target; exact ratios need no resize
+                            img.draft(img.mode, (width, height))
+                        else:
+                            # Decode at 1/2, 1/4 or 1/8 scale while staying at least
+                            # twice the target size, so LANCZOS still has detail to use
+                            img.draft(img.mode, (width * 2, height * 2))
+
+                    # Convert RGBA to RGB if saving as JPEG
+                    img = ImageConverter._handle_rgba_to_rgb(img, output_path, out_ext)
+
+                    # Perform resize. When shrinking, reduce with a box filter
+                    # first so LANCZOS only runs on a near-target image
+                    if img.size == (width, height):
+                        logger.debug(
+                            "Decoder produced the target size, skipping resize"
+                        )
+                        resized_img = img
+                    elif width <= img.width and height <= img.height:
+                        resized_img = img.resize(
+                            (width, height),
+                            Image.Resampling.LANCZOS,
+                            reducing_gap=REDUCING_GAP,
+                        )
+                    else:
+                        resized_img = img.resize(
+                            (width, height), Image.Resampling.LANCZOS
+                        )
 
-                # Save resized image
-                resized_img.save(output_path, **save_params)
+                    # Save resized image
+                    ImageConverter._save_image(
+                        resized_img, output_path, save_params, out_ext
+                    )
 
             logger.info(f"Successfully resized image to {width}x{height}")
 
@@ -231,22 +352,33 @@ class ImageConverter(BaseConverter):
             quality_value = validate_quality(quality) or DEFAULT_QUALITY
             
             # Open and rotate image
+            from PIL import Image
+
             with Image.open(input_path) as img:
-                # Rotate the image
-                rotated_img = img.rotate(angle, expand=expand, resample=Image.Resampling.BICUBIC)
+                # Rotate the image; a full turn is saved as-is instead of
+                # through the copy Image.rotate makes for it
+                if angle % 360 == 0:
+                    rotated_img = img
+                else:
+                    rotated_img = img.rotate(
+                        angle, expand=expand, resample=Image.Resampling.BICUBIC
+                    )
                 
                 # Convert RGBA to RGB if saving as JPEG
-                if output_path.suffix.lower() in ['.jpg', '.jpeg'] and rotated_img.mode == 'RGBA':
-                    logger.debug("Converting RGBA to RGB for JPEG output")
-                    rotated_img = rotated_img.convert('RGB')
+                out_ext = ImageConverter._output_suffix(output_path)
+                rotated_img = ImageConverter._handle_rgba_to_rgb(
+                    rotated_img, output_path, out_ext
+                )
                 
                 # Prepare save parameters
-                save_params = {}
-                if output_path.suffix.lower() in ['.jpg', '.jpeg', '.webp']:
-                    save_params['quality'] = quality_value
+                save_params = ImageConverter._prepare_save_params(
+                    output_path, quality_value, out_ext
+                )
                 
                 # Save rotated image
-                rotated_img.save(output_path, **save_params)
+                ImageConverter._save_image(
+                    rotated_img, output_path, save_params, out_ext
+                )
             
             logger.info(f"Successfully rotated image by {angle} degrees")
             
@@ -256,5 +388,41 @@ class ImageConverter(BaseConverter):
             logger.error(f"Error rotating image: {str(e)}")
             raise ValidationError(f"Error during image rotation: {str(e)}")
 
+    @staticmethod
+    def get_metadata(input_path: Union[str, Path]) -> Dict[str, Any]:
+        """
+        Read the size, mode and format of an image.
+
+        Only the file header is read; pixel data is never decoded.
+
+        Parameters
+        ----------
+        input_path : Union[str, Path]
+            Path to input image file
+
+        Returns
+        -------
+        Dict[str, Any]
+            Dictionary with 'size' as a (width, height) tuple, 'mode' and 'format'
+
+        Raises
+        ------
+        ValidationError
+            If the path is invalid or the file cannot be identified
+        """
+        try:
+            input_path = validate_image_path(input_path, should_exist=True)
+
+            from PIL import Image
+
+            with Image.open(input_path) as img:
+                return {'size': img.size, 'mode': img.mode, 'format': img.format}
+
+        except ValidationError:
+            raise
+        except Exception as e:
+            logger.error(f"Error reading image metadata: {str(e)}")
+            raise ValidationError(f"Error reading image metadata: {str(e)}")
+
 
 logger.debug("Converter module loaded")
@@ -1,36 +1,66 @@
 """Watermark module for OneImage."""
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Union, Tuple
+from typing import TYPE_CHECKING, BinaryIO, Dict, List, Optional, Union, Tuple
 import os
+import sys
 
-from PIL import Image, ImageDraw, ImageFont, ImageColor
 from loguru import logger
 
 from oneimage.utils.validators import validate_image_path, validate_quality, ValidationError
-from oneimage.core.base import DEFAULT_QUALITY
+from oneimage.core.base import BaseConverter
 
-class WatermarkProcessor:
-    """Handles image watermarking operations."""
+if TYPE_CHECKING:
+    from PIL import Image, ImageFont
+
+# Transparent margin around the text so antialiased edges are not clipped
+_TILE_PADDING = 2
 
-    FONT_PATHS = [
+# Font files to try, in order, for each sys.platform
+_PLATFORM_FONTS: Dict[str, List[str]] = {
+    "linux": [
         "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
         "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
         "/usr/share/fonts/TTF/DejaVuSans-Bold.ttf",
         "/usr/share/fonts/TTF/DejaVuSans.ttf",
-        "/Library/Fonts/Arial.ttf",  # macOS
-        "C:\\Windows\\Fonts\\arial.ttf",  # Windows
-    ]
+    ],
+    "darwin": ["/Library/Fonts/Arial.ttf"],
+    "win32": ["C:\\Windows\\Fonts\\arial.ttf"],
+}
+
+class WatermarkProcessor:
+    """Handles image watermarking operations."""
+
+    # Only this platform's fonts are checked; other platforms try them all
+    FONT_PATHS = _PLATFORM_FONTS.get(
+        sys.platform, [path for paths in _PLATFORM_FONTS.values() for path in paths]
+    )
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _existing_font_paths() -> Tuple[str, ...]:
+        """Get the entries of FONT_PATHS that exist, checked once per process."""
+        return tuple(
+            path for path in WatermarkProcessor.FONT_PATHS if os.path.exists(path)
+        )
 
     @staticmethod
-    def _get_font(size: int) -> ImageFont.FreeTypeFont:
-        """Get a font with the specified size."""
+    @lru_cache(maxsize=32)
+    def _get_font(size: int) -> "ImageFont.FreeTypeFont":
+        """
+        Get a font with the specified size.
+
+        Fonts are cached per size and shared between calls. Pillow fonts are
+        safe to render with from several threads, but must not be modified.
+        """
+        from PIL import Image, ImageDraw, ImageFont
+
         # Try system fonts first
-        for font_path in WatermarkProcessor.FONT_PATHS:
-            if os.path.exists(font_path):
-                try:
-                    return ImageFont.truetype(font_path, size)
-                except OSError:
-                    continue
+        for font_path in WatermarkProcessor._existing_font_paths():
+            try:
+                return ImageFont.truetype(font_path, size)
+            except OSError:
+                continue
 
         # If no system fonts work, use default font
         try:
@@ -46,16 +76,169 @@ class WatermarkProcessor:
             img = img.resize((size * 3, size * 3), Image.Resampling.LANCZOS)
             return ImageFont.load_default()
 
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _parse_color(color: str) -> Tuple[int, ...]:
+        """
+        Convert a color string to an RGB tuple.
+
+        Raises
+        ------
+        ValueError
+            If the color is not recognized (failures are not cached)
+        """
+        from PIL import ImageColor
+
+        return ImageColor.getrgb(color)
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _render_text_tile(
+        text: str,
+        font_size: int,
+        rgb_color: Tuple[int, ...],
+        opacity: int,
+    ) -> Tuple["Image.Image", Tuple[int, int, int, int]]:
+        """
+        Render text onto a transparent RGBA tile that covers its bounding box.
+
+        Tiles are cached so a batch watermarking with the same text renders
+        it once. The returned tile is shared and must not be modified.
+
+        Returns
+        -------
+        Tuple[Image.Image, Tuple[int, int, int, int]]
+            The tile and the text bounding box (left, top, right, bottom)
+        """
+        from PIL import Image, ImageDraw
+
+        font = WatermarkProcessor._get_font(font_size)
+        logger.debug("Using font: {}", font)
+
+        left, top, right, bottom = font.getbbox(text)
+        tile = Image.new(
+            'RGBA',
+            (right - left + 2 * _TILE_PADDING, bottom - top + 2 * _TILE_PADDING),
+            (0, 0, 0, 0)
+        )
+        ImageDraw.Draw(tile).text(
+            (_TILE_PADDING - left, _TILE_PADDING - top),
+            text,
+            font=font,
+            fill=(*rgb_color, int(255 * opacity / 100))
+        )
+        return tile, (left, top, right, bottom)
+
+    @staticmethod
+    def _validate_options(opacity: int, font_size: int) -> None:
+        """
+        Validate watermark opacity and font size.
+
+        Raises
+        ------
+        ValidationError
+            If either value is out of range
+        """
+        if not 0 <= opacity <= 100:
+            raise ValidationError(f"Opacity must be between 0 and 100, got {opacity}")
+        if font_size <= 0:
+            raise ValidationError(f"Font size must be greater than 0, got {font_size}")
+
+    @staticmethod
+    def apply_watermark(
+        img: "Image.Image",
+        text: str,
+        position: str = "bottom-right",
+        opacity: int = 50,
+        font_size: int = 36,
+        font_color: str = "white",
+        in_place: bool = False,
+    ) -> "Image.Image":
+        """
+        Add a text watermark to an image in memory.
+
+        Parameters
+        ----------
+        img : Image.Image
+            Image to watermark
+        text : str
+            Text to use as watermark
+        position : str
+            Position of watermark (top-left, top-right, bottom-left, bottom-right,
+            center)
+        opacity : int
+            Opacity of watermark (0-100)
+        font_size : int
+            Font size for watermark text
+        font_color : str
+            Color of watermark text
+        in_place : bool, optional
+            Draw directly on img when it is already RGBA instead of on a
+            copy, by default False
+
+        Returns
+        -------
+        Image.Image
+            Watermarked RGBA image
+
+        Raises
+        ------
+        ValidationError
+            If opacity, font size or position is invalid
+        """
+        WatermarkProcessor._validate_options(opacity, font_size)
+
+        # Convert color string to RGB tuple
+        try:
+            rgb_color = WatermarkProcessor._parse_color(font_color)
+        except ValueError:
+            logger.warning(f"Invalid color '{font_color}', using white")
+            rgb_color = WatermarkProcessor._parse_color("white")
+
+        # Draw the text on a transparent tile that only covers its
+        # bounding box instead of a layer the size of the image
+        tile, (left, top, right, bottom) = WatermarkProcessor._render_text_tile(
+            text, font_size, rgb_color, opacity
+        )
+
+        # Calculate position
+        x, y = WatermarkProcessor._calculate_position(
+            position, img.size, (right - left, bottom - top)
+        )
+
+        if img.mode != 'RGBA':
+            watermarked = img.convert('RGBA')
+        else:
+            watermarked = img if in_place else img.copy()
+
+        # Composite only the part of the tile that overlaps the image; the
+        # rest is cropped off, and a tile entirely outside draws nothing
+        tile_x = x + left - _TILE_PADDING
+        tile_y = y + top - _TILE_PADDING
+        x0, y0 = max(tile_x, 0), max(tile_y, 0)
+        x1 = min(tile_x + tile.width, watermarked.width)
+        y1 = min(tile_y + tile.height, watermarked.height)
+        if x1 <= x0 or y1 <= y0:
+            logger.debug("Watermark falls outside the {}x{} image", *watermarked.size)
+            return watermarked
+        watermarked.alpha_composite(
+            tile,
+            dest=(x0, y0),
+            source=(x0 - tile_x, y0 - tile_y, x1 - tile_x, y1 - tile_y),
+        )
+        return watermarked
+
     @staticmethod
     def add_watermark(
         input_path: Union[str, Path],
-        output_path: Union[str, Path],
+        output_path: Union[str, Path, BinaryIO],
         text: str,
         position: str = "bottom-right",
         opacity: int = 50,
         font_size: int = 36,
         font_color: str = "white",
         quality: Optional[Union[int, str]] = None,
+        suffix: Optional[str] = None,
     ) -> None:
         """
         Add a text watermark to an image.
@@ -64,8 +247,9 @@ class WatermarkProcessor:
         ----------
         input_path : Union[str, Path]
             Path to input image file
-        output_path : Union[str, Path]
-            Path where watermarked image will be saved
+        output_path : Union[str, Path, BinaryIO]
+            Path where watermarked image will be saved, or a binary file
+            object (such as io.BytesIO) to write it to
         text : str
             Text to use as watermark
         position : str
@@ -78,6 +262,9 @@ class WatermarkProcessor:
             Color of watermark text
         quality : Optional[Union[int, str]]
             Quality setting for lossy formats (1-100)
+        suffix : Optional[str], optional
+            Lowercase output suffix, by default derived from output_path;
+            required when output_path is a file object
 
         Raises
         ------
@@ -89,75 +276,39 @@ class WatermarkProcessor:
             
             # Validate paths
             input_path = validate_image_path(input_path, should_exist=True)
-            output_path = validate_image_path(output_path, should_exist=False)
+            output_path = BaseConverter._validate_output(output_path, suffix)
             
             # Validate quality
             quality_value = validate_quality(quality)
             
-            # Validate opacity
-            if not 0 <= opacity <= 100:
-                raise ValidationError(f"Opacity must be between 0 and 100, got {opacity}")
-            
-            # Validate font size
-            if font_size <= 0:
-                raise ValidationError(f"Font size must be greater than 0, got {font_size}")
+            # Validate opacity and font size before decoding anything
+            WatermarkProcessor._validate_options(opacity, font_size)
+
+            from PIL import Image
 
             # Open image
             with Image.open(input_path) as img:
-                # Create a copy to work with
-                watermarked = img.copy()
-                
-                # Create transparent layer for watermark
-                watermark = Image.new('RGBA', img.size, (0, 0, 0, 0))
-                draw = ImageDraw.Draw(watermark)
-                
-                # Get font with specified size
-                font = WatermarkProcessor._get_font(font_size)
-                logger.debug(f"Using font: {font}")
-                
-                # Get text size
-                text_bbox = draw.textbbox((0, 0), text, font=font)
-                text_width = text_bbox[2] - text_bbox[0]
-                text_height = text_bbox[3] - text_bbox[1]
-                
-                # Calculate position
-                x, y = WatermarkProcessor._calculate_position(
-                    position, watermark.size, (text_width, text_height)
+                # Opened images are not used again, so RGBA ones can be
+                # watermarked in place
+                watermarked = WatermarkProcessor.apply_watermark(
+                    img, text, position, opacity, font_size, font_color, in_place=True
                 )
-                
-                # Convert color string to RGB tuple
-                try:
-                    rgb_color = ImageColor.getrgb(font_color)
-                except ValueError:
-                    logger.warning(f"Invalid color '{font_color}', using white")
-                    rgb_color = ImageColor.getrgb("white")
-                
-                # Draw watermark text
-                draw.text(
-                    (x, y),
-                    text,
-                    font=font,
-                    fill=(*rgb_color, int(255 * opacity / 100))
-                )
-                
-                # Composite watermark onto image
-                watermarked = Image.alpha_composite(
-                    watermarked.convert('RGBA'),
-                    watermark
-                )
-                
+
                 # Convert RGBA to RGB if saving as JPEG
-                if output_path.suffix.lower() in ['.jpg', '.jpeg']:
-                    if watermarked.mode == 'RGBA':
-                        watermarked = watermarked.convert('RGB')
+                out_ext = suffix or BaseConverter._output_suffix(output_path)
+                watermarked = BaseConverter._handle_rgba_to_rgb(
+                    watermarked, output_path, out_ext
+                )
                 
                 # Prepare save parameters
-                save_params = {}
-                if output_path.suffix.lower() in ['.jpg', '.jpeg', '.webp']:
-                    save_params['quality'] = quality_value or DEFAULT_QUALITY
+                save_params = BaseConverter._prepare_save_params(
+                    output_path, quality_value, out_ext
+                )
                 
                 # Save watermarked image
-                watermarked.save(output_path, **save_params)
+                BaseConverter._save_image(
+                    watermarked, output_path, save_params, out_ext
+                )
             
             logger.info("Successfully added watermark")
             
@@ -2,12 +2,13 @@
 
 import os
 import stat
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Union
 
 from loguru import logger
 
-from ..config.settings import SUPPORTED_FORMATS
+from ..config.settings import SUPPORTED_FORMATS, SUPPORTED_FORMATS_DISPLAY
 
 
 class ValidationError(Exception):
@@ -56,6 +57,11 @@ def validate_image_path(path: Union[str, Path], should_exist: bool = True) -> Pa
     """
     Validate image file path.
 
+    The path is resolved like ``Path.resolve()``, except that a symlink in
+    the final component is kept as is. Each parent directory is resolved
+    once per process, and the file itself is checked on every call.
+    Call ``clear_path_cache()`` if directories may have moved.
+
     Parameters
     ----------
     path : Union[str, Path]
@@ -74,40 +80,39 @@ def validate_image_path(path: Union[str, Path], should_exist: bool = True) -> Pa
         If path is invalid.
     """
     try:
-        # Convert to Path and resolve
-        path = Path(path).resolve()
-        logger.debug(f"Validating path: {path} (should_exist={should_exist})")
+        # Resolve the directory (shared by every file in it), not the file.
+        # ".." is left to realpath, so it is applied after symlinks as with resolve()
+        path = os.path.join(os.getcwd(), os.fspath(path))
+        directory, name = os.path.split(path)
+        if name in ('', '.', '..'):
+            path = Path(os.path.realpath(path))
+        else:
+            path = Path(_resolved_parent(directory)) / name
+        logger.debug("Validating path: {} (should_exist={})", path, should_exist)
 
         if should_exist:
-            # Check existence
-            if not path.exists():
-                raise ValidationError(f"File does not exist: {path}")
-            
-            # Check if it's a file
-            if not path.is_file():
-                raise ValidationError(f"Path is not a file: {path}")
-            
-            # Check file permissions
+            # Check existence, type, permissions and size with a single stat call
             try:
-                mode = path.stat().st_mode
-                if not mode & stat.S_IRUSR:
-                    raise ValidationError(f"File is not readable: {path}")
+                st = path.stat()
+            except (FileNotFoundError, NotADirectoryError):
+                raise ValidationError(f"File does not exist: {path}")
             except OSError as e:
                 raise ValidationError(f"Cannot access file permissions: {path} ({str(e)})")
-            
-            # Check file size (optional)
-            try:
-                size = path.stat().st_size
-                logger.debug(f"File size: {size / 1024:.1f}KB")
-            except OSError as e:
-                logger.warning(f"Could not check file size: {path} ({str(e)})")
+
+            # Check if it's a file
+            if not stat.S_ISREG(st.st_mode):
+                raise ValidationError(f"Path is not a file: {path}")
+
+            if not st.st_mode & stat.S_IRUSR:
+                raise ValidationError(f"File is not readable: {path}")
+            logger.debug("File size: {:.1f}KB", st.st_size / 1024)
             
             # Check if input format is supported
             suffix = path.suffix.lower()
             if suffix not in SUPPORTED_FORMATS:
-                supported_formats_str = ', '.join(sorted(SUPPORTED_FORMATS))
                 raise ValidationError(
-                    f"Unsupported input format '{suffix[1:]}'. Supported formats: {supported_formats_str}"
+                    f"Unsupported input format '{suffix[1:]}'. "
+                    f"Supported formats: {SUPPORTED_FORMATS_DISPLAY}"
                 )
         else:
             # Check if parent directory exists and is writable
@@ -115,7 +120,7 @@ def validate_image_path(path: Union[str, Path], should_exist: bool = True) -> Pa
             if not parent.exists():
                 try:
                     parent.mkdir(parents=True, exist_ok=True)
-                    logger.debug(f"Created parent directory: {parent}")
+                    logger.debug("Created parent directory: {}", parent)
                 except Exception as e:
                     raise ValidationError(f"Cannot create output directory: {str(e)}")
             
@@ -129,9 +134,9 @@ def validate_image_path(path: Union[str, Path], should_exist: bool = True) -> Pa
             # Check if output format is supported
             suffix = path.suffix.lower()
             if suffix not in SUPPORTED_FORMATS:
-                supported_formats_str = ', '.join(sorted(SUPPORTED_FORMATS))
                 raise ValidationError(
-                    f"Unsupported output format '{suffix[1:]}'. Supported formats: {supported_formats_str}"
+                    f"Unsupported output format '{suffix[1:]}'. "
+                    f"Supported formats: {SUPPORTED_FORMATS_DISPLAY}"
                 )
 
         return path
@@ -142,4 +147,15 @@ def validate_image_path(path: Union[str, Path], should_exist: bool = True) -> Pa
         raise ValidationError(f"Invalid path: {str(e)}")
 
 
+@lru_cache(maxsize=1024)
+def _resolved_parent(directory: str) -> str:
+    """Resolve symlinks in a directory path, once per directory."""
+    return os.path.realpath(directory)
+
+
+def clear_path_cache() -> None:
+    """Forget the directories resolved by validate_image_path."""
+    _resolved_parent.cache_clear()
+
+
 logger.debug("Validators module loaded")
@@ -28,6 +28,10 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=requirements,
+    extras_require={
+        "simd": ["pillow-simd>=10.0.1"],
+        "vips": ["pyvips>=2.2"],
+    },
     entry_points={
         "console_scripts": [
             "oneimage=oneimage.cli.main:app",
@@ -1,11 +1,16 @@
 """Test configuration and fixtures for OneImage."""
 
 import os
+import random
+import shlex
 import shutil
+import sys
 from pathlib import Path
 
 import pytest
+import typer.main
 from PIL import Image
+from typer.testing import CliRunner, Result
 
 # Test data directory
 TEST_DATA_DIR = Path(__file__).parent / "test_data"
@@ -19,10 +24,34 @@ def setup_test_dirs():
     TEST_DATA_DIR.mkdir(exist_ok=True)
     TEST_OUTPUT_DIR.mkdir(exist_ok=True)
 
+    # Register Pillow's format plugins up front instead of in the first test
+    Image.init()
+
     yield
 
-    # Cleanup after all tests
-    shutil.rmtree(TEST_OUTPUT_DIR)
+    # Cleanup after all tests; with pytest-xdist another worker may already
+    # have removed it
+    shutil.rmtree(TEST_OUTPUT_DIR, ignore_errors=True)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def session_log_dir(tmp_path_factory):
+    """Keep CLI logs from tests that don't ask for them out of the working tree."""
+    from oneimage.cli import main
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv(main._LOG_DIR_ENV, str(tmp_path_factory.mktemp("logs")))
+        yield
+
+
+@pytest.fixture(autouse=True)
+def clear_path_cache():
+    """Don't let resolved directories leak between tests."""
+    from oneimage.utils.validators import clear_path_cache
+
+    clear_path_cache()
+    yield
+    clear_path_cache()
 
 
 @pytest.fixture(scope="session")
@@ -43,29 +72,143 @@ def test_images():
         filepath = TEST_DATA_DIR / filename
         if not filepath.exists():
             img = Image.new(mode, img_size, color)
-            img.save(filepath)
+            # Solid-color fixtures don't need zlib's effort
+            save_params = {"compress_level": 0} if filepath.suffix == ".png" else {}
+            img.save(filepath, **save_params)
         created_files[filename] = filepath
 
     return created_files
 
 
+@pytest.fixture(scope="session")
+def sample_png(tmp_path_factory):
+    """A 100x100 red PNG written once per session; copy it before modifying."""
+    path = tmp_path_factory.mktemp("images") / "original.png"
+    Image.new("RGB", (100, 100), "red").save(path, compress_level=0)
+    return path
+
+
+def make_image(size=(100, 100), mode="RGB", seed=0):
+    """Create a deterministic random-noise image with detail for encoders to work on."""
+    bands = Image.getmodebands(mode)
+    length = size[0] * size[1] * bands
+    data = random.Random(seed).getrandbits(8 * length).to_bytes(length, "little")
+    return Image.frombytes(mode, size, data)
+
+
+@pytest.fixture(scope="session")
+def noise_png(tmp_path_factory):
+    """A 100x100 random-noise PNG written once per session; copy it before modifying."""
+    path = tmp_path_factory.mktemp("images") / "noise.png"
+    make_image().save(path, compress_level=0)
+    return path
+
+
+@pytest.fixture(scope="session")
+def default_jpg_size(noise_png, tmp_path_factory):
+    """Size in bytes of noise_png encoded as JPEG at the default quality."""
+    from oneimage.core.converter import ImageConverter
+
+    output = tmp_path_factory.mktemp("reference") / "default.jpg"
+    ImageConverter.convert_image(noise_png, output)
+    return output.stat().st_size
+
+
+class AppRunner(CliRunner):
+    """Typer's CliRunner, invoking a Click command built once per Typer app."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._commands = {}
+
+    def invoke(
+        self, app, args=None, input=None, env=None, catch_exceptions=True,
+        color=False, **extra,
+    ):
+        """Run ``app`` like ``CliRunner.invoke`` and return its result."""
+        cli = self._commands.get(app)
+        if cli is None:
+            # CliRunner.invoke would otherwise rebuild the whole tree on every call
+            cli = self._commands[app] = typer.main.get_command(app)
+        if isinstance(args, str):
+            args = shlex.split(args)
+        prog_name = extra.pop("prog_name", None) or self.get_default_prog_name(cli)
+        return_value = exception = exc_info = None
+        exit_code = 0
+
+        with self.isolation(input=input, env=env, color=color) as streams:
+            try:
+                return_value = cli.main(args=args or (), prog_name=prog_name, **extra)
+            except SystemExit as e:
+                exc_info = sys.exc_info()
+                exit_code = 0 if e.code is None else e.code
+                if exit_code != 0:
+                    exception = e
+                if not isinstance(exit_code, int):
+                    sys.stdout.write(f"{exit_code}\n")
+                    exit_code = 1
+            except Exception as e:
+                if not catch_exceptions:
+                    raise
+                exception, exit_code, exc_info = e, 1, sys.exc_info()
+            finally:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                stdout, stderr, output = (stream.getvalue() for stream in streams)
+
+        return Result(
+            runner=self,
+            stdout_bytes=stdout,
+            stderr_bytes=stderr,
+            output_bytes=output,
+            return_value=return_value,
+            exit_code=exit_code,
+            exception=exception,
+            exc_info=exc_info,
+        )
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """Provide a CLI runner for testing; invoke() keeps no state between calls."""
+    return AppRunner()
+
+
+@pytest.fixture(scope="session")
+def mock_rgba():
+    """A transparent image shared by tests that stub rembg.remove; don't modify it."""
+    return Image.new("RGBA", (100, 100), (255, 0, 0, 0))
+
+
 @pytest.fixture
 def temp_output_dir(tmp_path):
-    """Create a temporary directory for test outputs."""
-    output_dir = tmp_path / "output"
-    output_dir.mkdir()
-    return output_dir
+    """Provide a temporary directory for test outputs."""
+    # tmp_path is already private to the test; no need for a subdirectory
+    return tmp_path
 
 
 @pytest.fixture
-def cleanup_logs():
-    """Clean up log files after tests."""
-    # Ensure logs directory exists
-    log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
-    
-    yield
-    
+def cleanup_logs(tmp_path, monkeypatch):
+    """Send CLI logs to a private directory, yield it, and clean up after."""
+    from loguru import logger
+    from oneimage.cli import main
+
+    # A log directory per test, so parallel workers don't share a log file
+    log_dir = tmp_path / "logs"
+    log_dir.mkdir()
+    monkeypatch.setenv(main._LOG_DIR_ENV, str(log_dir))
+
+    # Force the CLI to configure fresh sinks for this test
+    main._LOGGING_CONFIGURED = None
+
+    yield log_dir
+
+    # Release the file sink before removing its directory
+    logger.remove()
+    logger.enable("oneimage")
+    main._LOGGING_CONFIGURED = None
+    main._QUIET = False
+
     # Clean up log files
     if log_dir.exists():
         shutil.rmtree(log_dir)
@@ -0,0 +1,137 @@
+"""Tests for the optional image processing backends."""
+
+from unittest.mock import Mock
+
+import pytest
+from PIL import Image
+
+from oneimage.core import backends
+from oneimage.core.backends import VipsBackend
+from oneimage.core.converter import ImageConverter
+from oneimage.utils.validators import ValidationError
+
+
+@pytest.fixture
+def no_vips(mocker):
+    """Make pyvips look uninstalled."""
+    mocker.patch.object(backends, "_PYVIPS", None)
+    mocker.patch.object(backends, "_PYVIPS_CHECKED", True)
+
+
+@pytest.fixture
+def fake_vips(mocker):
+    """Replace pyvips with a mock whose thumbnails have no alpha channel."""
+    pyvips = Mock()
+    pyvips.Image.thumbnail.return_value.hasalpha.return_value = False
+    mocker.patch.object(backends, "_PYVIPS", pyvips)
+    mocker.patch.object(backends, "_PYVIPS_CHECKED", True)
+    return pyvips
+
+
+def test_resize_uses_pillow_by_default(test_images, temp_output_dir, fake_vips, mocker):
+    """Test that resize only uses libvips when asked to, even if it is installed."""
+    resize = mocker.spy(Image.Image, "resize")
+    output_file = temp_output_dir / "default.png"
+
+    ImageConverter.resize_image(test_images["rgb.png"], output_file, width=50)
+
+    fake_vips.Image.thumbnail.assert_not_called()
+    resize.assert_called_once()
+    with Image.open(output_file) as img:
+        assert img.size == (50, 50)
+
+
+def test_vips_backend_requires_pyvips(test_images, temp_output_dir, no_vips):
+    """Test that asking for libvips without pyvips fails instead of falling back."""
+    with pytest.raises(ValidationError, match="requires pyvips"):
+        ImageConverter.resize_image(
+            test_images["rgb.png"], temp_output_dir / "out.png",
+            width=50, backend="vips",
+        )
+
+
+def test_unknown_backend(test_images, temp_output_dir):
+    """Test that an unknown backend name is rejected."""
+    with pytest.raises(ValidationError, match="Unknown backend 'gpu'"):
+        ImageConverter.resize_image(
+            test_images["rgb.png"], temp_output_dir / "out.png",
+            width=50, backend="gpu",
+        )
+
+
+@pytest.mark.parametrize("output_name,fast,expected", [
+    ("out.jpg", False, {"Q": 70}),
+    ("out.jpg", True, {
+        "Q": 70, "optimize_coding": False, "interlace": False, "subsample_mode": "on"
+    }),
+    ("out.png", True, {"compression": 1}),
+    ("out.webp", True, {"Q": 70, "effort": 0}),
+])
+def test_vips_resize_maps_save_settings(
+    test_images, temp_output_dir, fake_vips, mocker, output_name, fast, expected
+):
+    """Test that the vips backend translates every Pillow save setting."""
+    resize = mocker.spy(Image.Image, "resize")
+    input_file = test_images["rgb.png"]
+    output_file = temp_output_dir / output_name
+
+    ImageConverter.resize_image(
+        input_file, output_file,
+        width=40, height=30, quality=70, fast=fast, backend="vips",
+    )
+
+    resize.assert_not_called()
+    fake_vips.Image.thumbnail.assert_called_once_with(
+        str(input_file), 30, height=30, size="force", no_rotate=True
+    )
+    thumbnail = fake_vips.Image.thumbnail.return_value
+    thumbnail.write_to_file.assert_called_once_with(str(output_file), **expected)
+
+
+@pytest.mark.parametrize("save_params", [{"subsampling": 1}, {"exif": b""}])
+def test_vips_save_options_without_equivalent(save_params):
+    """Test that settings libvips cannot express are reported as unsupported."""
+    assert VipsBackend.save_options(".jpg", save_params) is None
+    assert VipsBackend.save_options(".gif", {}) is None
+
+
+def test_vips_resize_falls_back_without_draft(
+    test_images, temp_output_dir, fake_vips, mocker
+):
+    """Test that pixel-exact resizes stay on Pillow when libvips is requested."""
+    resize = mocker.spy(Image.Image, "resize")
+    output_file = temp_output_dir / "exact.png"
+
+    ImageConverter.resize_image(
+        test_images["rgb.png"], output_file, width=50, draft=False, backend="vips"
+    )
+
+    fake_vips.Image.thumbnail.assert_not_called()
+    resize.assert_called_once()
+
+
+@pytest.mark.parametrize("input_name,output_name,mode", [
+    ("rgba.png", "vips.jpg", "RGB"),
+    ("rgba.png", "vips.png", "RGBA"),
+    ("test.jpg", "vips.webp", "RGB"),
+])
+def test_vips_resize(
+    test_images, temp_output_dir, mocker, input_name, output_name, mode
+):
+    """Test resizing through libvips."""
+    pytest.importorskip("pyvips")
+    if not VipsBackend.available():
+        pytest.skip("libvips is not installed")
+    resize = mocker.spy(Image.Image, "resize")
+    output_file = temp_output_dir / output_name
+
+    ImageConverter.resize_image(
+        test_images[input_name], output_file,
+        width=40, height=30, quality=70, backend="vips",
+    )
+
+    resize.assert_not_called()
+    with Image.open(output_file) as img:
+        # 100x100 inputs fit into 40x30 as 30x30
+        assert img.size == (30, 30)
+        assert img.mode == mode
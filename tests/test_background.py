@@ -1,19 +1,98 @@
 """Tests for background removal functionality."""
 
+import subprocess
+import sys
+
 import pytest
 from PIL import Image
 from pathlib import Path
 
+from oneimage.core import background
 from oneimage.core.background import BackgroundRemover
 from oneimage.utils.validators import ValidationError
 
 
+@pytest.fixture(autouse=True)
+def clear_session_cache(mocker):
+    """Isolate the process-wide session cache between tests."""
+    mocker.patch.dict(background._SESSION_CACHE, clear=True)
+    mocker.patch.dict(background._SESSION_USERS, clear=True)
+
+
 def test_background_remover_init():
     """Test BackgroundRemover initialization."""
     remover = BackgroundRemover()
     assert remover._sessions == {}
 
 
+def test_sessions_shared_between_instances(mocker):
+    """Test that sessions are reused by every BackgroundRemover."""
+    mock_session = mocker.patch.object(background, "new_session")
+
+    session1 = BackgroundRemover()._get_session("u2net")
+    session2 = BackgroundRemover()._get_session("u2net")
+
+    assert session1 is session2
+    mock_session.assert_called_once_with("u2net")
+
+
+def test_sessions_loaded_once_across_threads(mocker):
+    """Test that concurrent callers share a single model load."""
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    def slow_session(model_name):
+        time.sleep(0.05)
+        return object()
+
+    mock_session = mocker.patch.object(
+        background, "new_session", side_effect=slow_session
+    )
+    barrier = threading.Barrier(4)
+
+    def get_session(_):
+        barrier.wait()
+        return BackgroundRemover()._get_session("u2net")
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        sessions = list(executor.map(get_session, range(4)))
+
+    assert all(session is sessions[0] for session in sessions)
+    mock_session.assert_called_once_with("u2net")
+
+
+def test_close_releases_sessions(mocker):
+    """Test that closing a remover drops the loaded sessions."""
+    mock_session = mocker.patch.object(background, "new_session")
+
+    with BackgroundRemover() as remover:
+        remover._get_session("u2net")
+        assert "u2net" in remover._sessions
+
+    assert not remover._sessions
+    BackgroundRemover()._get_session("u2net")
+    assert mock_session.call_count == 2
+
+
+def test_close_keeps_sessions_other_removers_use(mocker):
+    """Test that closing one remover leaves sessions another open remover uses."""
+    mock_session = mocker.patch.object(background, "new_session")
+    other = BackgroundRemover()
+    other._get_session("u2net")
+
+    with BackgroundRemover() as remover:
+        remover._get_session("u2net")
+        remover._get_session("u2netp")
+
+    assert list(background._SESSION_CACHE) == ["u2net"]
+    other.close()
+    other.close()
+    assert not background._SESSION_CACHE
+    assert not background._SESSION_USERS
+    assert mock_session.call_count == 2
+
+
 def test_get_session():
     """Test session management."""
     remover = BackgroundRemover()
@@ -66,11 +145,21 @@ def test_remove_background_invalid_alpha_matting_params(test_images):
         )
 
 
-def test_remove_background_basic(test_images, mocker):
+@pytest.mark.parametrize("params, message", [
+    ((300, 10, 10), "foreground threshold must be between 0 and 255, got 300"),
+    ((240, 256, 10), "background threshold must be between 0 and 255, got 256"),
+    ((240, 10, -1), "erode size must be non-negative, got -1"),
+])
+def test_validate_alpha_matting_messages(params, message):
+    """Test alpha matting validation reports the offending parameter."""
+    with pytest.raises(ValidationError, match=message):
+        BackgroundRemover._validate_alpha_matting(*params)
+
+
+def test_remove_background_basic(test_images, mocker, mock_rgba):
     """Test basic background removal functionality."""
     # Mock rembg.remove to avoid actual model loading and processing
-    mock_output = Image.new("RGBA", (100, 100), (255, 0, 0, 0))
-    mock_remove = mocker.patch("oneimage.core.background.remove", return_value=mock_output)
+    mock_remove = mocker.patch.object(background, "remove", return_value=mock_rgba)
     
     remover = BackgroundRemover()
     input_path = test_images["rgb.png"]
@@ -84,11 +173,10 @@ def test_remove_background_basic(test_images, mocker):
     assert result.mode == "RGBA"  # Background removal should produce RGBA image
 
 
-def test_remove_background_with_alpha_matting(test_images, mocker):
+def test_remove_background_with_alpha_matting(test_images, mocker, mock_rgba):
     """Test background removal with alpha matting enabled."""
     # Mock rembg.remove
-    mock_output = Image.new("RGBA", (100, 100), (255, 0, 0, 0))
-    mock_remove = mocker.patch("oneimage.core.background.remove", return_value=mock_output)
+    mock_remove = mocker.patch.object(background, "remove", return_value=mock_rgba)
     
     remover = BackgroundRemover()
     input_path = test_images["rgb.png"]
@@ -111,12 +199,11 @@ def test_remove_background_with_alpha_matting(test_images, mocker):
     assert call_kwargs["alpha_matting_erode_size"] == 10
 
 
-def test_remove_background_different_models(test_images, mocker):
+def test_remove_background_different_models(test_images, mocker, mock_rgba):
     """Test background removal with different models."""
     # Mock rembg functions
-    mock_output = Image.new("RGBA", (100, 100), (255, 0, 0, 0))
-    mocker.patch("oneimage.core.background.remove", return_value=mock_output)
-    mock_session = mocker.patch("oneimage.core.background.new_session")
+    mocker.patch.object(background, "remove", return_value=mock_rgba)
+    mock_session = mocker.patch.object(background, "new_session")
     
     remover = BackgroundRemover()
     input_path = test_images["rgb.png"]
@@ -127,3 +214,102 @@ def test_remove_background_different_models(test_images, mocker):
         result = remover.remove_background(input_path, model_name=model)
         assert isinstance(result, Image.Image)
         assert model in remover._sessions
+
+
+def test_remove_background_batch(test_images, mocker, mock_rgba):
+    """Test batch background removal loads the model only once."""
+    mock_remove = mocker.patch.object(background, "remove", return_value=mock_rgba)
+    mock_session = mocker.patch.object(background, "new_session")
+
+    remover = BackgroundRemover()
+    input_paths = [test_images["rgb.png"], test_images["test.jpg"]]
+
+    results = list(remover.remove_background_batch(input_paths, model_name="u2netp"))
+
+    assert [path for path, _ in results] == [Path(p).resolve() for p in input_paths]
+    assert all(isinstance(result, Image.Image) for _, result in results)
+    assert mock_remove.call_count == 2
+    mock_session.assert_called_once_with("u2netp")
+
+
+def test_remove_background_batch_invalid_alpha_matting_params(test_images, mocker):
+    """Test batch background removal validates parameters before loading the model."""
+    mock_session = mocker.patch.object(background, "new_session")
+    remover = BackgroundRemover()
+
+    with pytest.raises(ValidationError):
+        list(remover.remove_background_batch(
+            [test_images["rgb.png"]],
+            alpha_matting=True,
+            alpha_matting_erode_size=-5
+        ))
+
+    mock_session.assert_not_called()
+
+
+def test_remove_background_bytes_input(test_images, mocker):
+    """Test encoded input is handed to rembg without decoding it first."""
+    mock_remove = mocker.patch.object(background, "remove", return_value=b"png data")
+    mocker.patch.object(background, "new_session")
+
+    data = Path(test_images["rgb.png"]).read_bytes()
+    result = BackgroundRemover().remove_background(data)
+
+    assert result == b"png data"
+    assert mock_remove.call_args.args[0] is data
+
+
+def test_remove_background_image_input(mocker, mock_rgba):
+    """Test an already loaded image is handed to rembg as-is."""
+    mock_remove = mocker.patch.object(background, "remove", return_value=mock_rgba)
+    mocker.patch.object(background, "new_session")
+
+    image = Image.new("RGB", (100, 100), (255, 0, 0))
+    result = BackgroundRemover().remove_background(image)
+
+    assert result is mock_rgba
+    assert mock_remove.call_args.args[0] is image
+
+
+def test_invalid_params_do_not_import_rembg(test_images):
+    """Test that rembg is only imported once a removal actually runs."""
+    code = (
+        "import sys\n"
+        "from oneimage.core.background import BackgroundRemover\n"
+        "from oneimage.utils.validators import ValidationError\n"
+        "try:\n"
+        f"    BackgroundRemover().remove_background({str(test_images['rgb.png'])!r}, "
+        "alpha_matting=True, alpha_matting_foreground_threshold=300)\n"
+        "except ValidationError:\n"
+        "    pass\n"
+        "print('rembg' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+@pytest.mark.parametrize("available,expected", [
+    (["CPUExecutionProvider"], None),
+    (
+        ["CPUExecutionProvider", "CUDAExecutionProvider", "CoreMLExecutionProvider"],
+        ["CUDAExecutionProvider", "CoreMLExecutionProvider", "CPUExecutionProvider"],
+    ),
+])
+def test_session_providers(mocker, available, expected):
+    """Test that available accelerators are preferred over the CPU."""
+    import onnxruntime
+
+    mocker.patch.object(onnxruntime, "get_available_providers", return_value=available)
+    mock_session = mocker.patch.object(background, "new_session")
+    background._session_providers.cache_clear()
+    try:
+        BackgroundRemover()._get_session("u2net")
+    finally:
+        background._session_providers.cache_clear()
+
+    if expected is None:
+        mock_session.assert_called_once_with("u2net")
+    else:
+        mock_session.assert_called_once_with("u2net", providers=expected)
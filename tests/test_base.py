@@ -67,3 +67,77 @@ def test_handle_rgba_to_rgb_case_insensitive():
     
     converted = BaseConverter._handle_rgba_to_rgb(img, output_path)
     assert converted.mode == "RGB"
+
+def test_precomputed_suffix_overrides_path():
+    """Test that a precomputed suffix is used instead of the path suffix."""
+    img = Image.new('RGBA', (100, 100))
+    output_path = Path("test.png")
+
+    params = BaseConverter._prepare_save_params(output_path, suffix=".jpg")
+    assert params["quality"] == DEFAULT_QUALITY
+    converted = BaseConverter._handle_rgba_to_rgb(img, output_path, suffix=".jpg")
+    assert converted.mode == "RGB"
+
+def test_output_suffix():
+    """Test that output suffixes are lowercased and interned."""
+    suffix = BaseConverter._output_suffix("photo.JPEG")
+    assert suffix == ".jpeg"
+    assert suffix is BaseConverter._output_suffix(Path("other.jpeg"))
+
+@pytest.mark.parametrize("path,expected", [
+    ("photo.PNG", ".png"),
+    ("archive.tar.WebP", ".webp"),
+    ("dir.with.dots/photo", ""),
+    (".hidden", ""),
+])
+def test_output_suffix_matches_pathlib(path, expected):
+    """Test that output suffixes agree with Path.suffix."""
+    assert BaseConverter._output_suffix(path) == expected == Path(path).suffix.lower()
+
+@pytest.mark.parametrize("suffix,expected", [
+    (".png", {"compress_level": 1}),
+    (".webp", {"quality": DEFAULT_QUALITY, "method": 0}),
+    (".jpg", {
+        "quality": DEFAULT_QUALITY,
+        "optimize": False,
+        "progressive": False,
+        "subsampling": 2,
+    }),
+])
+def test_prepare_save_params_fast(suffix, expected):
+    """Test the fast encoder presets."""
+    params = BaseConverter._prepare_save_params(Path("test" + suffix), fast=True)
+    assert params == expected
+
+def test_prepare_save_params_compress_level():
+    """Test that an explicit PNG compression level wins over the fast preset."""
+    params = BaseConverter._prepare_save_params(
+        Path("test.png"), fast=True, compress_level=9
+    )
+    assert params == {"compress_level": 9}
+    params = BaseConverter._prepare_save_params(Path("test.jpg"), compress_level=9)
+    assert params == {"quality": DEFAULT_QUALITY}
+
+def test_save_image_uses_suffix_format(tmp_path):
+    """Test that the output format comes from the suffix."""
+    output_path = tmp_path / "out.jpeg"
+    BaseConverter._save_image(Image.new("RGB", (10, 10)), output_path, {"quality": 90})
+    with Image.open(output_path) as img:
+        assert img.format == "JPEG"
+
+def test_save_image_removes_partial_file(tmp_path):
+    """Test that a failed save does not leave a partial file behind."""
+    output_path = tmp_path / "out.jpg"
+    with pytest.raises(OSError):
+        # JPEG cannot store RGBA
+        BaseConverter._save_image(Image.new("RGBA", (10, 10)), output_path, {})
+    assert not output_path.exists()
+
+def test_save_image_onto_its_own_input(tmp_path):
+    """Test that an image can be saved over the file it was opened from."""
+    path = tmp_path / "same.png"
+    Image.new("RGB", (10, 10), "red").save(path)
+    with Image.open(path) as img:
+        BaseConverter._save_image(img, path, {})
+    with Image.open(path) as img:
+        assert img.getpixel((0, 0)) == (255, 0, 0)
@@ -0,0 +1,59 @@
+"""Tests for parallel batch conversion."""
+
+import pytest
+from PIL import Image
+
+from oneimage.core.batch import ConvertJob, batch_convert, run_job
+from oneimage.utils.validators import ValidationError
+
+
+def test_batch_convert(test_images, temp_output_dir):
+    """Test running convert and resize jobs in worker processes."""
+    jobs = [
+        ConvertJob(test_images["rgb.png"], temp_output_dir / "batch.jpg"),
+        ConvertJob(
+            test_images["test.jpg"],
+            temp_output_dir / "batch.webp",
+            operation="resize",
+            width=50,
+        ),
+    ]
+
+    results = list(batch_convert(jobs, max_workers=2))
+
+    output_names = sorted(result.job.output_path.name for result in results)
+    assert output_names == ["batch.jpg", "batch.webp"]
+    assert all(result.ok for result in results)
+    with Image.open(temp_output_dir / "batch.webp") as img:
+        assert img.size == (50, 50)
+
+
+def test_batch_convert_reports_failures(test_images, temp_output_dir):
+    """Test that a failing job does not stop the others."""
+    jobs = [
+        ConvertJob(temp_output_dir / "missing.png", temp_output_dir / "missing.jpg"),
+        ConvertJob(test_images["rgb.png"], temp_output_dir / "ok.jpg"),
+    ]
+
+    results = {
+        result.job.output_path.name: result
+        for result in batch_convert(jobs, max_workers=2)
+    }
+
+    assert not results["missing.jpg"].ok
+    assert "does not exist" in results["missing.jpg"].error
+    assert results["ok.jpg"].ok
+    assert (temp_output_dir / "ok.jpg").exists()
+
+
+def test_batch_convert_no_jobs():
+    """Test that an empty batch yields nothing."""
+    assert list(batch_convert([])) == []
+
+
+def test_run_job_unknown_operation(test_images, temp_output_dir):
+    """Test that unknown operations are rejected."""
+    with pytest.raises(ValidationError, match="Unknown operation"):
+        run_job(ConvertJob(
+            test_images["rgb.png"], temp_output_dir / "out.png", operation="blur"
+        ))
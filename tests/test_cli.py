@@ -1,26 +1,57 @@
 """Tests for CLI functionality."""
+import io
+import os
+import shutil
+import subprocess
+import sys
+from functools import lru_cache
+
 import pytest
 from pathlib import Path
-from typer.testing import CliRunner
 from PIL import Image
 from unittest.mock import Mock
 
+from oneimage.cli import main
+from oneimage.core import background
 from oneimage.cli.main import app
 
 # Test constants
 TEST_WIDTH = 100
 TEST_HEIGHT = 100
 
+@lru_cache(maxsize=None)
+def _encoded_test_image(mode: str, suffix: str) -> bytes:
+    """Encode the white test image once per mode and file format."""
+    buffer = io.BytesIO()
+    img = Image.new(mode, (TEST_WIDTH, TEST_HEIGHT), color='white')
+    format_name = Image.registered_extensions()[suffix.lower()]
+    # Stored (uncompressed) PNG: no deflate on write, a plain copy on read
+    save_params = {"compress_level": 0} if format_name == "PNG" else {}
+    img.save(buffer, format=format_name, **save_params)
+    return buffer.getvalue()
+
 def create_test_image(path: Path, mode: str = 'RGB'):
     """Create a test image for CLI tests."""
-    img = Image.new(mode, (TEST_WIDTH, TEST_HEIGHT), color='white')
-    img.save(path)
+    path = Path(path)
+    path.write_bytes(_encoded_test_image(mode, path.suffix))
+
+
+def fake_remove(data, **kwargs):
+    """Stand-in for rembg.remove that mirrors its input and output types."""
+    output = Image.new("RGBA", (100, 100), (255, 0, 0, 0))
+    if isinstance(data, bytes):
+        buffer = io.BytesIO()
+        output.save(buffer, format="PNG")
+        return buffer.getvalue()
+    return output
 
 
-@pytest.fixture
-def runner():
-    """Provide a CLI runner for testing."""
-    return CliRunner()
+@pytest.fixture(autouse=True)
+def mock_rembg(mocker):
+    """Keep every CLI test away from ONNX runtime and model downloads."""
+    mocker.patch.object(background, "new_session", return_value=Mock())
+    mocker.patch.object(background, "remove", side_effect=fake_remove)
+    mocker.patch.dict(background._SESSION_CACHE, clear=True)
 
 
 def test_version(runner):
@@ -30,6 +61,27 @@ def test_version(runner):
     assert "version" in result.stdout.lower()
 
 
+def test_version_from_metadata(runner, mocker):
+    """Test that --version reports the installed distribution version."""
+    mocker.patch("importlib.metadata.version", return_value="9.8.7")
+    result = runner.invoke(app, ["--version"])
+    assert result.exit_code == 0
+    assert "9.8.7" in result.stdout
+
+
+def test_version_fallback(runner, mocker):
+    """Test that --version falls back to the package version when not installed."""
+    from importlib.metadata import PackageNotFoundError
+    from oneimage import __version__
+
+    mocker.patch(
+        "importlib.metadata.version", side_effect=PackageNotFoundError("oneimage")
+    )
+    result = runner.invoke(app, ["--version"])
+    assert result.exit_code == 0
+    assert __version__ in result.stdout
+
+
 def test_help(runner):
     """Test --help flag."""
     result = runner.invoke(app, ["--help"])
@@ -38,6 +90,52 @@ def test_help(runner):
     assert "Options" in result.stdout
 
 
+def test_runner_builds_command_once(runner, mocker):
+    """Test that the runner converts a Typer app to a Click command only once."""
+    import typer
+    import typer.main
+
+    demo = typer.Typer()
+
+    @demo.command()
+    def greet(name: str) -> None:
+        typer.echo(f"Hello {name}")
+        raise typer.Exit(3)
+
+    get_command = mocker.spy(typer.main, "get_command")
+    results = [runner.invoke(demo, ["World"]), runner.invoke(demo, "Again")]
+
+    assert get_command.call_count == 1
+    assert [(r.exit_code, r.output) for r in results] == [
+        (3, "Hello World\n"), (3, "Hello Again\n")
+    ]
+
+
+def test_import_defers_heavy_dependencies():
+    """Test that importing the CLI does not load the image/logging stack."""
+    code = (
+        "import sys, oneimage.cli.main; "
+        "print(','.join(m for m in ('PIL', 'loguru', 'rembg', 'rich.panel') "
+        "if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_import_core_defers_pillow():
+    """Test that importing the core modules does not load Pillow."""
+    code = (
+        "import sys, oneimage.core.batch, oneimage.core.watermark; "
+        "print('PIL' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
 def test_convert_command_help(runner):
     """Test convert command help."""
     result = runner.invoke(app, ["convert", "--help"])
@@ -45,35 +143,39 @@ def test_convert_command_help(runner):
     assert "Convert an image" in result.stdout
 
 
-def test_convert_basic(runner, test_images, temp_output_dir):
-    """Test basic conversion command."""
+@pytest.mark.parametrize("extra_args", [[], ["--quality", "50"]])
+def test_convert_basic(runner, test_images, temp_output_dir, extra_args):
+    """Test conversion with and without a quality parameter."""
     input_file = test_images["rgb.png"]
     output_file = temp_output_dir / "output.jpg"
-    
+
     result = runner.invoke(app, [
         "convert",
         str(input_file),
-        str(output_file)
+        str(output_file),
+        *extra_args
     ])
-    
+
     assert result.exit_code == 0
     assert output_file.exists()
 
 
-def test_convert_with_quality(runner, test_images, temp_output_dir):
-    """Test conversion with quality parameter."""
-    input_file = test_images["rgb.png"]
-    output_file = temp_output_dir / "output.jpg"
-    
+def test_convert_fast_options(runner, test_images, temp_output_dir, mocker):
+    """Test that convert forwards the encoder speed options."""
+    mock_convert = mocker.patch("oneimage.core.converter.ImageConverter.convert_image")
+    output_file = temp_output_dir / "output.png"
+
     result = runner.invoke(app, [
         "convert",
-        str(input_file),
+        str(test_images["rgb.png"]),
         str(output_file),
-        "--quality", "50"
+        "--fast",
+        "--compress-level", "3"
     ])
-    
+
     assert result.exit_code == 0
-    assert output_file.exists()
+    assert mock_convert.call_args.kwargs["fast"] is True
+    assert mock_convert.call_args.kwargs["compress_level"] == 3
 
 
 def test_convert_with_logging(runner, test_images, temp_output_dir, cleanup_logs):
@@ -90,50 +192,29 @@ def test_convert_with_logging(runner, test_images, temp_output_dir, cleanup_logs
     
     assert result.exit_code == 0
     assert output_file.exists()
-    assert Path("logs/oneimage.log").exists()
+    assert (cleanup_logs / "oneimage.log").exists()
 
 
-def test_convert_nonexistent_file(runner, temp_output_dir):
-    """Test conversion with nonexistent input file."""
-    result = runner.invoke(app, [
-        "convert",
-        "nonexistent.png",
-        str(temp_output_dir / "output.jpg")
-    ])
-    
-    assert result.exit_code != 0
-    assert "Error" in result.stdout
+@pytest.mark.parametrize("input_name,output_name,extra_args", [
+    pytest.param(None, "output.jpg", [], id="nonexistent_file"),
+    pytest.param("rgb.png", "output.invalid", [], id="invalid_format"),
+    pytest.param("rgb.png", "output.jpg", ["--quality", "101"], id="invalid_quality"),
+])
+def test_convert_invalid(
+    runner, test_images, temp_output_dir, input_name, output_name, extra_args
+):
+    """Test conversion errors for bad input files, formats and quality values."""
+    input_file = test_images[input_name] if input_name else "nonexistent.png"
 
-
-def test_convert_invalid_format(runner, test_images, temp_output_dir):
-    """Test conversion with invalid output format."""
-    input_file = test_images["rgb.png"]
-    output_file = temp_output_dir / "output.invalid"
-    
     result = runner.invoke(app, [
         "convert",
         str(input_file),
-        str(output_file)
+        str(temp_output_dir / output_name),
+        *extra_args
     ])
-    
-    assert result.exit_code != 0
-    assert "Error" in result.stdout
-
 
-def test_convert_invalid_quality(runner, test_images, temp_output_dir):
-    """Test conversion with invalid quality value."""
-    input_file = test_images["rgb.png"]
-    output_file = temp_output_dir / "output.jpg"
-    
-    result = runner.invoke(app, [
-        "convert",
-        str(input_file),
-        str(output_file),
-        "--quality", "101"
-    ])
-    
     assert result.exit_code != 0
-    assert "Error" in result.stdout
+    assert "Error" in result.output
 
 
 @pytest.mark.parametrize("log_level", ["DEBUG", "INFO", "WARNING", "ERROR"])
@@ -152,7 +233,154 @@ def test_log_levels(runner, test_images, temp_output_dir, cleanup_logs, log_leve
     
     assert result.exit_code == 0
     assert output_file.exists()
-    assert Path("logs/oneimage.log").exists()
+    # The log file is only created once a record passes the level filter
+    assert (cleanup_logs / "oneimage.log").exists() == (log_level in ("DEBUG", "INFO"))
+
+
+@pytest.mark.parametrize("extra_args,backend", [
+    ([], "pillow"),
+    (["--backend", "vips"], "vips"),
+    (["--backend", "VIPS"], "vips"),
+])
+def test_resize_backend_option(
+    runner, test_images, temp_output_dir, mocker, extra_args, backend
+):
+    """Test that resize only asks for libvips with --backend vips."""
+    from oneimage.core.converter import ImageConverter
+
+    mock_resize = mocker.patch.object(ImageConverter, "resize_image")
+
+    result = runner.invoke(app, [
+        "resize",
+        str(test_images["rgb.png"]),
+        str(temp_output_dir / "output.png"),
+        "--width", "50",
+        *extra_args,
+    ])
+
+    assert result.exit_code == 0
+    assert mock_resize.call_args.kwargs["backend"] == backend
+
+
+def test_quiet_disables_logging(
+    runner, test_images, temp_output_dir, cleanup_logs, mocker
+):
+    """Test that --quiet adds no log sinks and disables oneimage logging."""
+    shutil.rmtree(cleanup_logs)
+    add = mocker.spy(main._log(), "add")
+    disable = mocker.spy(main._log(), "disable")
+
+    result = runner.invoke(app, [
+        "--quiet",
+        "resize",
+        str(test_images["rgb.png"]),
+        str(temp_output_dir / "output.png"),
+        "--width", "50",
+        "--show-logs",
+    ])
+
+    assert result.exit_code == 0
+    add.assert_not_called()
+    disable.assert_called_with("oneimage")
+    assert not cleanup_logs.exists()
+
+
+def test_setup_logging_is_idempotent(cleanup_logs, mocker):
+    """Test that repeated logging setup with the same settings is a no-op."""
+    add = mocker.spy(main._log(), "add")
+
+    main.setup_logging(show_logs=False, log_level="INFO")
+    main.setup_logging(show_logs=False, log_level="INFO")
+    assert add.call_count == 1
+
+    main.setup_logging(show_logs=True, log_level="INFO")
+    assert add.call_count == 3
+
+
+@pytest.mark.parametrize("is_tty", [True, False])
+def test_emit_ok(capsys, mocker, is_tty):
+    """Test that panels are only rendered when stdout is a terminal."""
+    from rich.console import Console
+
+    mocker.patch.object(main, "_IS_TTY", is_tty)
+    mocker.patch.object(main, "_CONSOLE", Console(force_terminal=False, width=80))
+
+    main._emit_ok("[green]Done[/green] [bold]image.png[/bold]")
+
+    output = capsys.readouterr().out
+    assert "Done image.png" in output
+    assert ("Success" in output) == is_tty
+    assert "[green]" not in output
+
+
+def test_plain_output_skips_rich():
+    """Test that piped output is printed without importing rich."""
+    code = (
+        "import sys, oneimage.cli.main as main; "
+        "main._emit_ok('[green]Done[/green] [bold]image.png[/bold]'); "
+        "main._emit_err('[red]Error:[/red] bad \\\\[input]', panel=True); "
+        "print(','.join(m for m in ('rich.console', 'rich.text') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.splitlines() == ["Done image.png", "Error: bad [input]", ""]
+
+
+@pytest.mark.parametrize("command", ["rotate", "watermark"])
+@pytest.mark.parametrize("show_logs", [False, True])
+def test_console_logging_is_opt_in(runner, tmp_path, mocker, command, show_logs):
+    """Test that commands only log to the console with --show-logs."""
+    input_path = tmp_path / "test_input.png"
+    create_test_image(input_path)
+    mock_setup = mocker.patch("oneimage.cli.main.setup_logging")
+
+    args = [command, str(input_path), str(tmp_path / "test_output.png")]
+    if command == "watermark":
+        args += ["--text", "Test"]
+    if show_logs:
+        args.append("--show-logs")
+    result = runner.invoke(app, args)
+
+    assert result.exit_code == 0
+    # None keeps whatever the global options configured
+    mock_setup.assert_called_with(show_logs=show_logs or None, log_level=None)
+
+
+@pytest.mark.parametrize("args,expected", [
+    (["--logging", "--log-level", "DEBUG", "rotate"], (True, "DEBUG", False)),
+    (["--logging", "rotate", "--log-level", "warning"], (True, "WARNING", False)),
+    (["rotate", "--show-logs"], (True, "INFO", False)),
+    (["rotate"], (False, "INFO", False)),
+])
+def test_command_logging_options_override_global_ones(
+    runner, tmp_path, cleanup_logs, args, expected
+):
+    """Test that command options only replace the global settings they name."""
+    input_path = tmp_path / "test_input.png"
+    create_test_image(input_path)
+
+    result = runner.invoke(
+        app, [*args, str(input_path), str(tmp_path / "test_output.png")]
+    )
+
+    assert result.exit_code == 0
+    assert main._LOGGING_CONFIGURED == expected
+
+
+def test_setup_logging_accepts_plain_level_names(cleanup_logs, mocker):
+    """Test that setup_logging takes level names as plain strings."""
+    add = mocker.spy(main._log(), "add")
+
+    main.setup_logging(log_level="debug")
+    main.setup_logging(log_level=main.LogLevel.DEBUG)
+
+    assert add.call_count == 1
+    assert add.call_args.kwargs["level"] == "DEBUG"
+    assert type(add.call_args.kwargs["level"]) is str
+
+    with pytest.raises(ValueError):
+        main.setup_logging(log_level="verbose")
 
 
 def test_watermark_command_help(runner):
@@ -238,8 +466,7 @@ def test_watermark_invalid_opacity(runner, tmp_path):
 def test_remove_bg_command(runner, test_images, temp_output_dir, mocker):
     """Test the remove-bg command."""
     # Mock background removal to avoid actual processing
-    mock_output = Image.new("RGBA", (100, 100), (255, 0, 0, 0))
-    mocker.patch("oneimage.core.background.remove", return_value=mock_output)
+    mock_remove = mocker.patch.object(background, "remove", side_effect=fake_remove)
     
     input_path = test_images["rgb.png"]
     output_path = temp_output_dir / "output_nobg.png"
@@ -250,12 +477,16 @@ def test_remove_bg_command(runner, test_images, temp_output_dir, mocker):
     assert "Successfully removed background" in result.stdout
     assert output_path.exists()
 
+    # PNG output is written straight from rembg's encoded result
+    assert isinstance(mock_remove.call_args.args[0], bytes)
+    with Image.open(output_path) as img:
+        assert img.mode == "RGBA"
+
 
 def test_remove_bg_command_with_options(runner, test_images, temp_output_dir, mocker):
     """Test the remove-bg command with various options."""
     # Mock background removal
-    mock_output = Image.new("RGBA", (100, 100), (255, 0, 0, 0))
-    mock_remove = mocker.patch("oneimage.core.background.remove", return_value=mock_output)
+    mock_remove = mocker.patch.object(background, "remove", side_effect=fake_remove)
     
     input_path = test_images["rgb.png"]
     output_path = temp_output_dir / "output_nobg_options.png"
@@ -286,6 +517,24 @@ def test_remove_bg_command_with_options(runner, test_images, temp_output_dir, mo
     assert call_kwargs["alpha_matting_erode_size"] == 15
 
 
+def test_remove_bg_command_jpeg_output(runner, test_images, temp_output_dir, mocker):
+    """Test the remove-bg command decodes and re-encodes for non-PNG output."""
+    mock_remove = mocker.patch.object(background, "remove", side_effect=fake_remove)
+    mocker.patch.object(background, "new_session")
+    mocker.patch.dict(background._SESSION_CACHE, clear=True)
+
+    output_path = temp_output_dir / "output_nobg.webp"
+
+    result = runner.invoke(app, [
+        "remove-bg", str(test_images["rgb.png"]), str(output_path)
+    ])
+
+    assert result.exit_code == 0
+    assert isinstance(mock_remove.call_args.args[0], Image.Image)
+    with Image.open(output_path) as img:
+        assert img.format == "WEBP"
+
+
 def test_remove_bg_command_invalid_input(runner, temp_output_dir):
     """Test the remove-bg command with invalid input."""
     # Test with non-existent input file
@@ -313,3 +562,309 @@ def test_remove_bg_command_invalid_params(runner, test_images, temp_output_dir):
     ])
     assert result.exit_code == 1
     assert "Error" in result.stdout
+
+
+def test_remove_bg_batch_command(runner, test_images, tmp_path, mocker, mock_rgba):
+    """Test the remove-bg-batch command."""
+    mock_remove = mocker.patch.object(background, "remove", return_value=mock_rgba)
+    mock_session = mocker.patch.object(background, "new_session")
+    mocker.patch.dict(background._SESSION_CACHE, clear=True)
+
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    create_test_image(input_dir / "first.png")
+    create_test_image(input_dir / "second.jpg")
+    (input_dir / "notes.txt").write_text("not an image")
+    output_dir = tmp_path / "output"
+
+    result = runner.invoke(app, ["remove-bg-batch", str(input_dir), str(output_dir)])
+
+    assert result.exit_code == 0
+    assert "Successfully removed background" in result.stdout
+    assert (output_dir / "first.png").exists()
+    assert (output_dir / "second.png").exists()
+    assert mock_remove.call_count == 2
+    mock_session.assert_called_once()
+
+
+def test_remove_bg_batch_command_reports_failures(runner, tmp_path, mocker, mock_rgba):
+    """Test that a failing image does not stop a remove-bg-batch run."""
+    mocker.patch.object(background, "remove", return_value=mock_rgba)
+    mocker.patch.object(background, "new_session")
+    mocker.patch.dict(background._SESSION_CACHE, clear=True)
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    create_test_image(input_dir / "good.png")
+    (input_dir / "broken.png").write_bytes(b"not an image")
+    output_dir = tmp_path / "output"
+
+    result = runner.invoke(app, ["remove-bg-batch", str(input_dir), str(output_dir)])
+
+    assert result.exit_code == 1
+    assert "broken.png" in result.stdout
+    assert "Failed to process 1 of 2 images" in result.stdout
+    assert [path.name for path in output_dir.iterdir()] == ["good.png"]
+
+
+def test_remove_bg_batch_command_rejects_output_collisions(runner, tmp_path, mocker):
+    """Test that remove-bg-batch refuses inputs that share an output file."""
+    mock_remove = mocker.patch.object(background, "remove")
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    create_test_image(input_dir / "photo.png")
+    create_test_image(input_dir / "photo.jpg")
+    output_dir = tmp_path / "output"
+
+    result = runner.invoke(app, ["remove-bg-batch", str(input_dir), str(output_dir)])
+
+    assert result.exit_code == 1
+    assert "photo.jpg, photo.png" in result.stdout
+    assert not output_dir.exists()
+    mock_remove.assert_not_called()
+
+
+def test_remove_bg_batch_command_no_images(runner, tmp_path):
+    """Test the remove-bg-batch command with a directory without images."""
+    result = runner.invoke(app, [
+        "remove-bg-batch", str(tmp_path), str(tmp_path / "output")
+    ])
+
+    assert result.exit_code == 1
+    assert "Error" in result.stdout
+
+
+@pytest.mark.parametrize("op,extra_args", [
+    ("convert", ["--format", "webp"]),
+    ("resize", ["--format", "webp", "--width", "50"]),
+])
+def test_batch_command(runner, tmp_path, op, extra_args):
+    """Test the batch command's convert and resize operations in worker processes."""
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    create_test_image(input_dir / "first.png")
+    create_test_image(input_dir / "second.jpg")
+    (input_dir / "notes.txt").write_text("not an image")
+    output_dir = tmp_path / "output"
+
+    result = runner.invoke(app, [
+        "batch", str(input_dir), str(output_dir),
+        "--op", op, "--workers", "2", *extra_args
+    ])
+
+    assert result.exit_code == 0
+    assert "Successfully processed 2 images" in result.stdout
+    assert (output_dir / "first.webp").exists()
+    assert (output_dir / "second.webp").exists()
+    # notes.txt is not an image and must be skipped, not converted
+    assert sorted(p.name for p in output_dir.iterdir()) == ["first.webp", "second.webp"]
+    with Image.open(output_dir / "second.webp") as img:
+        assert img.format == "WEBP"
+    if op == "resize":
+        with Image.open(output_dir / "first.webp") as img:
+            assert img.width == 50
+
+
+def thread_pool(max_workers=None, mp_context=None, **kwargs):
+    """Stand-in for ProcessPoolExecutor that runs workers in threads, for mocks."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    return ThreadPoolExecutor(max_workers=max_workers, **kwargs)
+
+
+def test_batch_command_remove_bg(runner, tmp_path, mocker):
+    """Test the batch command with background removal workers."""
+    mocker.patch("oneimage.core.batch.ProcessPoolExecutor", thread_pool)
+    mock_remove = mocker.patch.object(background, "remove", side_effect=fake_remove)
+    mock_session = mocker.patch.object(background, "new_session")
+    mocker.patch.dict(background._SESSION_CACHE, clear=True)
+
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    create_test_image(input_dir / "first.png")
+    create_test_image(input_dir / "second.jpg")
+    output_dir = tmp_path / "output"
+
+    result = runner.invoke(app, [
+        "batch", str(input_dir), str(output_dir), "--op", "remove-bg", "--workers", "1"
+    ])
+
+    assert result.exit_code == 0
+    assert (output_dir / "first.png").exists()
+    assert (output_dir / "second.png").exists()
+    assert mock_remove.call_count == 2
+    mock_session.assert_called_once_with("u2net")
+
+
+def test_batch_command_remove_bg_reports_failures(runner, tmp_path, mocker):
+    """Test that a failing image does not stop a remove-bg batch."""
+    mocker.patch("oneimage.core.batch.ProcessPoolExecutor", thread_pool)
+
+    def remove_or_fail(data, **kwargs):
+        if data == b"not an image":
+            raise ValueError("cannot identify image file")
+        return fake_remove(data, **kwargs)
+
+    mocker.patch.object(background, "remove", side_effect=remove_or_fail)
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    create_test_image(input_dir / "good.png")
+    (input_dir / "broken.png").write_bytes(b"not an image")
+    output_dir = tmp_path / "output"
+
+    result = runner.invoke(app, [
+        "batch", str(input_dir), str(output_dir), "--op", "remove-bg", "--workers", "1"
+    ])
+
+    assert result.exit_code == 1
+    assert "broken.png" in result.stdout
+    assert "Failed to process 1 of 2 images" in result.stdout
+    assert (output_dir / "good.png").exists()
+    assert not (output_dir / "broken.png").exists()
+
+
+def test_batch_command_reports_failures(runner, tmp_path):
+    """Test that the batch command processes every image and reports failures."""
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    create_test_image(input_dir / "good.png")
+    (input_dir / "broken.png").write_bytes(b"not an image")
+    output_dir = tmp_path / "output"
+
+    result = runner.invoke(app, [
+        "batch", str(input_dir), str(output_dir), "--format", "jpg", "--jobs", "2"
+    ])
+
+    assert result.exit_code == 1
+    assert "broken.png" in result.stdout
+    assert "Failed to process 1 of 2 images" in result.stdout
+    assert (output_dir / "good.jpg").exists()
+
+
+@pytest.mark.parametrize("global_args", [[], ["--quiet"]])
+def test_batch_workers_keep_stderr_clean(tmp_path, global_args):
+    """Test that batch workers follow the CLI's logging setup, not loguru's default."""
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    create_test_image(input_dir / "first.png")
+    create_test_image(input_dir / "second.png")
+    # Run from tmp_path, so make the package importable without installing it
+    repo_root = str(Path(__file__).resolve().parents[1])
+    python_path = os.pathsep.join(
+        filter(None, [repo_root, os.environ.get("PYTHONPATH")])
+    )
+    env = dict(
+        os.environ, ONEIMAGE_LOG_DIR=str(tmp_path / "logs"), PYTHONPATH=python_path
+    )
+
+    # Workers write to the inherited stderr, which CliRunner cannot capture
+    result = subprocess.run(
+        [
+            sys.executable, "-m", "oneimage.cli.main", *global_args,
+            "batch", str(input_dir), str(tmp_path / "output"),
+            "--format", "jpg", "--jobs", "2",
+        ],
+        capture_output=True, text=True, env=env, cwd=tmp_path,
+    )
+
+    assert result.returncode == 0
+    assert result.stderr == ""
+    # Worker records go to the log file unless --quiet disabled logging
+    assert (tmp_path / "logs" / "oneimage.log").exists() == (not global_args)
+
+
+def test_batch_workers_log_through_parent(tmp_path):
+    """Test that worker records end up in the one log file the CLI rotates."""
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    for name in ("first", "second", "third"):
+        create_test_image(input_dir / f"{name}.png")
+    repo_root = str(Path(__file__).resolve().parents[1])
+    python_path = os.pathsep.join(
+        filter(None, [repo_root, os.environ.get("PYTHONPATH")])
+    )
+    log_dir = tmp_path / "logs"
+    env = dict(os.environ, ONEIMAGE_LOG_DIR=str(log_dir), PYTHONPATH=python_path)
+
+    result = subprocess.run(
+        [
+            sys.executable, "-m", "oneimage.cli.main",
+            "batch", str(input_dir), str(tmp_path / "output"),
+            "--format", "jpg", "--jobs", "2", "--log-level", "DEBUG",
+        ],
+        capture_output=True, text=True, env=env, cwd=tmp_path,
+    )
+
+    assert result.returncode == 0
+    assert [path.name for path in log_dir.iterdir()] == ["oneimage.log"]
+    log_text = (log_dir / "oneimage.log").read_text()
+    assert log_text.count("Starting conversion") == 3
+
+
+def test_worker_logging_leaves_sinks_to_parent(cleanup_logs, mocker):
+    """Test that a worker queues its records rather than opening the log file."""
+    import queue
+    from loguru import logger
+
+    mocker.patch("multiprocessing.parent_process", return_value=Mock())
+    log_queue = queue.Queue()
+    main._init_worker_logging(log_queue, "DEBUG", False)
+    logger.debug("Written by a worker")
+
+    # Only the parent's sink may write, and rotate, the log file
+    assert list(cleanup_logs.iterdir()) == []
+
+    logger.remove()
+    main.setup_logging(log_level="DEBUG")
+    log_queue.put(None)
+    main._write_worker_logs(log_queue)
+    # Flush the buffered file sink
+    logger.remove()
+    log_text = (cleanup_logs / "oneimage.log").read_text()
+    assert "Written by a worker" in log_text
+
+
+def test_batch_command_rejects_output_collisions(runner, tmp_path):
+    """Test that inputs with the same stem are not written to the same output."""
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    create_test_image(input_dir / "photo.png")
+    create_test_image(input_dir / "photo.jpg")
+    output_dir = tmp_path / "output"
+
+    result = runner.invoke(app, [
+        "batch", str(input_dir), str(output_dir), "--format", "webp"
+    ])
+
+    assert result.exit_code == 1
+    assert "photo.jpg, photo.png" in result.stdout
+    assert not output_dir.exists()
+
+
+def test_batch_command_invalid_format(runner, tmp_path):
+    """Test the batch command with an unsupported output format."""
+    create_test_image(tmp_path / "first.png")
+
+    result = runner.invoke(app, [
+        "batch", str(tmp_path), str(tmp_path / "output"), "--format", "gif"
+    ])
+
+    assert result.exit_code == 1
+    assert "Unsupported output format" in result.stdout
+
+
+def test_batch_command_matches_suffix_case_insensitively(runner, tmp_path):
+    """Test that the batch command picks up images with upper or mixed case suffixes."""
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    for name in ("upper.JPG", "title.Png", "mixed.wEbP"):
+        create_test_image(input_dir / name)
+    output_dir = tmp_path / "output"
+
+    result = runner.invoke(app, [
+        "batch", str(input_dir), str(output_dir), "--format", "png"
+    ])
+
+    assert result.exit_code == 0
+    assert sorted(p.name for p in output_dir.iterdir()) == [
+        "mixed.png", "title.png", "upper.png"
+    ]
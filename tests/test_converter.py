@@ -1,13 +1,24 @@
 """Tests for the image converter functionality."""
 
+import io
+
 import pytest
 from pathlib import Path
 from PIL import Image
 
+from oneimage.core.base import _SAVE_PROFILES
 from oneimage.core.converter import ImageConverter
 from oneimage.utils.validators import ValidationError
 
 
+def convert_to_bytes(input_file, suffix):
+    """Convert an image in memory and reopen the result."""
+    buffer = io.BytesIO()
+    ImageConverter.convert_image(input_file, buffer, suffix=suffix)
+    buffer.seek(0)
+    return Image.open(buffer)
+
+
 def test_convert_png_to_jpg(test_images, temp_output_dir):
     """Test converting PNG to JPG."""
     input_file = test_images["rgb.png"]
@@ -21,57 +32,56 @@ def test_convert_png_to_jpg(test_images, temp_output_dir):
         assert img.mode == "RGB"
 
 
-def test_convert_jpg_to_webp(test_images, temp_output_dir):
+def test_convert_jpg_to_webp(test_images):
     """Test converting JPG to WebP."""
-    input_file = test_images["test.jpg"]
-    output_file = temp_output_dir / "output.webp"
-    
-    ImageConverter.convert_image(input_file, output_file)
-    
-    assert output_file.exists()
-    with Image.open(output_file) as img:
+    with convert_to_bytes(test_images["test.jpg"], ".webp") as img:
         assert img.format == "WEBP"
 
 
-def test_convert_with_quality(test_images, temp_output_dir):
+def test_convert_with_quality(noise_png, temp_output_dir, default_jpg_size):
     """Test converting with quality parameter."""
-    input_file = test_images["rgb.png"]
+    # Noise, unlike a solid color, gives quality something to discard
+    input_file = noise_png
     output_file = temp_output_dir / "output.jpg"
     
     ImageConverter.convert_image(input_file, output_file, quality=50)
     
     assert output_file.exists()
     # Check file size is smaller than with default quality
-    default_output = temp_output_dir / "default.jpg"
-    ImageConverter.convert_image(input_file, default_output)
-    
-    assert output_file.stat().st_size < default_output.stat().st_size
+    assert output_file.stat().st_size < default_jpg_size
 
 
-def test_convert_rgba_to_jpg(test_images, temp_output_dir):
+def test_convert_rgba_to_jpg(test_images):
     """Test converting RGBA image to JPG (which doesn't support alpha)."""
-    input_file = test_images["rgba.png"]
-    output_file = temp_output_dir / "output.jpg"
-    
-    ImageConverter.convert_image(input_file, output_file)
-    
-    assert output_file.exists()
-    with Image.open(output_file) as img:
+    with convert_to_bytes(test_images["rgba.png"], ".jpg") as img:
+        assert img.format == "JPEG"
         assert img.mode == "RGB"  # Should be converted to RGB
 
 
-def test_convert_grayscale(test_images, temp_output_dir):
+def test_convert_grayscale(test_images):
     """Test converting grayscale image."""
-    input_file = test_images["grayscale.png"]
-    output_file = temp_output_dir / "output.png"
-    
-    ImageConverter.convert_image(input_file, output_file)
-    
-    assert output_file.exists()
-    with Image.open(output_file) as img:
+    with convert_to_bytes(test_images["grayscale.png"], ".png") as img:
         assert img.mode == "L"  # Should preserve grayscale mode
 
 
+def test_convert_to_file_object_copies_same_format(test_images):
+    """Test that a same-format conversion into a file object copies the bytes."""
+    buffer = io.BytesIO()
+
+    ImageConverter.convert_image(test_images["grayscale.png"], buffer, suffix=".png")
+
+    assert buffer.getvalue() == test_images["grayscale.png"].read_bytes()
+
+
+@pytest.mark.parametrize("suffix", [None, ".gif"])
+def test_convert_to_file_object_needs_supported_suffix(test_images, suffix):
+    """Test that writing to a file object requires a supported output suffix."""
+    with pytest.raises(ValidationError, match="suffix|Unsupported output format"):
+        ImageConverter.convert_image(
+            test_images["rgb.png"], io.BytesIO(), suffix=suffix
+        )
+
+
 def test_convert_invalid_input_path():
     """Test converting with invalid input path."""
     with pytest.raises(ValidationError):
@@ -107,3 +117,164 @@ def test_convert_with_out_of_range_quality(test_images, temp_output_dir, quality
     
     with pytest.raises(ValidationError):
         ImageConverter.convert_image(input_file, output_file, quality=quality)
+
+
+@pytest.mark.parametrize("output_name", ["output.png", "output.webp", "output.jpg"])
+def test_convert_fast(test_images, temp_output_dir, mocker, output_name):
+    """Test that fast mode passes the fast presets to Pillow."""
+    save = mocker.spy(Image.Image, "save")
+    output_file = temp_output_dir / output_name
+
+    ImageConverter.convert_image(test_images["rgb.png"], output_file, fast=True)
+
+    assert output_file.exists()
+    assert save.call_args.kwargs == {
+        "format": _SAVE_PROFILES[output_file.suffix].format,
+        **ImageConverter._prepare_save_params(output_file, fast=True),
+    }
+
+
+def test_resize_compress_level(test_images, temp_output_dir, mocker):
+    """Test that resize forwards the PNG compression level."""
+    mocker.patch("oneimage.core.converter.VipsBackend.available", return_value=False)
+    save = mocker.spy(Image.Image, "save")
+    output_file = temp_output_dir / "resized.png"
+
+    ImageConverter.resize_image(
+        test_images["rgb.png"], output_file, width=50, compress_level=0
+    )
+
+    assert save.call_args.kwargs == {"format": "PNG", "compress_level": 0}
+
+
+@pytest.mark.parametrize("draft", [True, False])
+def test_resize_jpeg_draft(tmp_path, mocker, draft):
+    """Test that shrinking a JPEG decodes it at reduced scale unless disabled."""
+    mocker.patch("oneimage.core.converter.VipsBackend.available", return_value=False)
+    input_file = tmp_path / "large.jpg"
+    Image.new("RGB", (800, 600), (200, 100, 50)).save(input_file)
+    output_file = tmp_path / "small.png"
+    resize = mocker.spy(Image.Image, "resize")
+
+    ImageConverter.resize_image(input_file, output_file, width=100, draft=draft)
+
+    # Shrinking 8x with a 2x margin lets the decoder scale by 1/4
+    decoded = resize.call_args.args[0]
+    assert decoded.size == ((200, 150) if draft else (800, 600))
+    with Image.open(output_file) as img:
+        assert img.size == (100, 75)
+
+
+@pytest.mark.parametrize("width,resized", [(200, False), (300, True)])
+def test_resize_fast_jpeg_decodes_to_target(tmp_path, mocker, width, resized):
+    """Test that fast mode lets the JPEG decoder scale by exact ratios."""
+    mocker.patch("oneimage.core.converter.VipsBackend.available", return_value=False)
+    input_file = tmp_path / "large.jpg"
+    Image.new("RGB", (800, 600), (200, 100, 50)).save(input_file)
+    output_file = tmp_path / "small.jpg"
+    resize = mocker.spy(Image.Image, "resize")
+
+    ImageConverter.resize_image(input_file, output_file, width=width, fast=True)
+
+    assert resize.called is resized
+    with Image.open(output_file) as img:
+        assert img.size == (width, width * 3 // 4)
+
+
+@pytest.mark.parametrize("width,reduced", [(20, True), (300, False)])
+def test_resize_reducing_gap(test_images, temp_output_dir, mocker, width, reduced):
+    """Test that only shrinking resizes use two-stage reduction."""
+    mocker.patch("oneimage.core.converter.VipsBackend.available", return_value=False)
+    resize = mocker.spy(Image.Image, "resize")
+    output_file = temp_output_dir / "reduced.png"
+
+    ImageConverter.resize_image(test_images["rgb.png"], output_file, width=width)
+
+    assert ("reducing_gap" in resize.call_args.kwargs) == reduced
+    with Image.open(output_file) as img:
+        assert img.size == (width, width)
+
+
+@pytest.mark.parametrize("input_name,output_name", [
+    ("rgb.png", "copy.png"),
+    ("test.jpg", "copy.jpeg"),
+    ("test.webp", "copy.webp"),
+])
+def test_convert_same_format_copies(
+    test_images, temp_output_dir, mocker, input_name, output_name
+):
+    """Test that converting to the input's own format copies the file."""
+    save = mocker.spy(Image.Image, "save")
+    output_file = temp_output_dir / output_name
+
+    ImageConverter.convert_image(test_images[input_name], output_file)
+
+    save.assert_not_called()
+    assert output_file.read_bytes() == test_images[input_name].read_bytes()
+
+
+def test_convert_same_format_with_quality_reencodes(
+    test_images, temp_output_dir, mocker
+):
+    """Test that an explicit quality still re-encodes same-format images."""
+    save = mocker.spy(Image.Image, "save")
+
+    ImageConverter.convert_image(
+        test_images["test.jpg"], temp_output_dir / "copy.jpg", quality=50
+    )
+
+    save.assert_called_once()
+
+
+def test_convert_mislabeled_input_reencodes(test_images, temp_output_dir):
+    """Test that the copy is based on the decoded format, not the file name."""
+    input_file = temp_output_dir / "actually_jpeg.png"
+    input_file.write_bytes(test_images["test.jpg"].read_bytes())
+    output_file = temp_output_dir / "output.png"
+
+    ImageConverter.convert_image(input_file, output_file)
+
+    with Image.open(output_file) as img:
+        assert img.format == "PNG"
+
+
+def test_convert_onto_itself(test_images, temp_output_dir):
+    """Test that converting a file onto itself leaves it untouched."""
+    input_file = temp_output_dir / "self.png"
+    input_file.write_bytes(test_images["rgb.png"].read_bytes())
+
+    ImageConverter.convert_image(input_file, input_file)
+
+    assert input_file.read_bytes() == test_images["rgb.png"].read_bytes()
+
+
+def test_get_metadata(test_images, mocker):
+    """Test reading image metadata without decoding pixels."""
+    load = mocker.spy(Image.Image, "load")
+
+    metadata = ImageConverter.get_metadata(test_images["test.jpg"])
+
+    with Image.open(test_images["test.jpg"]) as img:
+        assert metadata == {"size": img.size, "mode": img.mode, "format": "JPEG"}
+    load.assert_not_called()
+
+
+def test_get_metadata_invalid_file(temp_output_dir):
+    """Test reading metadata from a file that is not an image."""
+    bogus = temp_output_dir / "bogus.png"
+    bogus.write_bytes(b"not an image")
+
+    with pytest.raises(ValidationError, match="Error reading image metadata"):
+        ImageConverter.get_metadata(bogus)
+
+
+def test_converter_module_defines_one_class():
+    """Test that converter.py defines ImageConverter once, with its full API."""
+    import ast
+    import oneimage.core.converter as converter
+
+    tree = ast.parse(Path(converter.__file__).read_text(encoding="utf-8"))
+    classes = [node.name for node in tree.body if isinstance(node, ast.ClassDef)]
+    assert classes.count("ImageConverter") == 1
+    for name in ("convert_image", "resize_image", "rotate_image", "get_metadata"):
+        assert callable(getattr(ImageConverter, name, None))
@@ -2,7 +2,6 @@
 
 import pytest
 from pathlib import Path
-from typer.testing import CliRunner
 from PIL import Image
 
 from oneimage.cli.main import app
@@ -12,18 +11,6 @@ from oneimage.core.converter import ImageConverter
 TEST_WIDTH = 100
 TEST_HEIGHT = 100
 
-@pytest.fixture
-def runner():
-    """Create a CLI runner for testing."""
-    return CliRunner()
-
-
-@pytest.fixture
-def temp_output_dir(tmp_path):
-    """Create a temporary directory for test outputs."""
-    return tmp_path
-
-
 def create_test_image(path: Path, size=(100, 100), color='red'):
     """Create a test image for testing."""
     img = Image.new('RGB', size, color)
@@ -31,88 +18,55 @@ def create_test_image(path: Path, size=(100, 100), color='red'):
     return path
 
 
-def test_resize_image_width_only(temp_output_dir):
-    """Test resizing image with only width specified."""
-    input_path = create_test_image(temp_output_dir / "original.png")
-    output_path = temp_output_dir / "resized_width.png"
-    
-    ImageConverter.resize_image(input_path, output_path, width=50)
-    
-    with Image.open(output_path) as img:
-        assert img.size[0] == 50  # width should be exactly 50
-        assert img.size[1] > 0     # height should be calculated
-
-
-def test_resize_image_height_only(temp_output_dir):
-    """Test resizing image with only height specified."""
-    input_path = create_test_image(temp_output_dir / "original.png")
-    output_path = temp_output_dir / "resized_height.png"
-    
-    ImageConverter.resize_image(input_path, output_path, height=50)
-    
-    with Image.open(output_path) as img:
-        assert img.size[1] == 50  # height should be exactly 50
-        assert img.size[0] > 0     # width should be calculated
-
-
-def test_resize_image_both_dimensions(temp_output_dir):
-    """Test resizing image with both dimensions specified."""
-    input_path = create_test_image(temp_output_dir / "original.png", size=(200, 100))
-    output_path = temp_output_dir / "resized_both.png"
-    
-    ImageConverter.resize_image(input_path, output_path, width=100, height=100)
-    
-    with Image.open(output_path) as img:
-        # One dimension should be exactly 100, the other might be smaller to maintain aspect ratio
-        assert img.size[0] <= 100 and img.size[1] <= 100
-        assert img.size[0] == 100 or img.size[1] == 50  # maintain aspect ratio
+@pytest.mark.parametrize("size,output_name,kwargs,expected_size,expected_format", [
+    pytest.param((100, 100), "resized.png", {"width": 50}, (50, 50), "PNG",
+                 id="width_only"),
+    pytest.param((100, 100), "resized.png", {"height": 50}, (50, 50), "PNG",
+                 id="height_only"),
+    # Both dimensions fit the image inside the box, keeping its aspect ratio
+    pytest.param((200, 100), "resized.png", {"width": 100, "height": 100}, (100, 50),
+                 "PNG", id="both_dimensions"),
+    pytest.param((100, 100), "resized.png",
+                 {"width": 50, "height": 75, "maintain_aspect_ratio": False},
+                 (50, 75), "PNG", id="no_aspect_ratio"),
+    pytest.param((100, 100), "resized.jpg", {"width": 50, "quality": 50}, (50, 50),
+                 "JPEG", id="quality"),
+])
+def test_resize_image(
+    temp_output_dir, sample_png, size, output_name, kwargs, expected_size,
+    expected_format,
+):
+    """Test resizing image with different dimensions and options."""
+    if size == (100, 100):
+        input_path = sample_png
+    else:
+        input_path = create_test_image(temp_output_dir / "original.png", size=size)
+    output_path = temp_output_dir / output_name
+
+    ImageConverter.resize_image(input_path, output_path, **kwargs)
 
-
-def test_resize_image_no_aspect_ratio(temp_output_dir):
-    """Test resizing image without maintaining aspect ratio."""
-    input_path = create_test_image(temp_output_dir / "original.png")
-    output_path = temp_output_dir / "resized_no_aspect.png"
-    
-    ImageConverter.resize_image(input_path, output_path, width=50, height=75, maintain_aspect_ratio=False)
-    
     with Image.open(output_path) as img:
-        assert img.size == (50, 75)  # both dimensions should match exactly
+        assert img.size == expected_size
+        assert img.format == expected_format
 
 
-def test_resize_image_invalid_dimensions(temp_output_dir):
+@pytest.mark.parametrize("kwargs,match", [
+    pytest.param({}, "At least one of width or height must be specified",
+                 id="no_dimensions"),
+    pytest.param({"width": -100}, "Width must be positive", id="negative_width"),
+    pytest.param({"height": -100}, "Height must be positive", id="negative_height"),
+])
+def test_resize_image_invalid_dimensions(temp_output_dir, sample_png, kwargs, match):
     """Test resizing image with invalid dimensions."""
-    input_path = create_test_image(temp_output_dir / "original.png")
-    output_path = temp_output_dir / "invalid.png"
-    
-    with pytest.raises(ValidationError, match="At least one of width or height must be specified"):
-        ImageConverter.resize_image(input_path, output_path)
-    
-    with pytest.raises(ValidationError, match="Width must be positive"):
-        ImageConverter.resize_image(input_path, output_path, width=-100)
-    
-    with pytest.raises(ValidationError, match="Height must be positive"):
-        ImageConverter.resize_image(input_path, output_path, height=-100)
+    with pytest.raises(ValidationError, match=match):
+        ImageConverter.resize_image(
+            sample_png, temp_output_dir / "invalid.png", **kwargs
+        )
 
 
-def test_resize_image_quality(temp_output_dir):
-    """Test resizing image with quality parameter."""
-    input_path = create_test_image(temp_output_dir / "original.png")
-    output_path = temp_output_dir / "resized_quality.jpg"
-    
-    ImageConverter.resize_image(input_path, output_path, width=50, quality=50)
-    
-    # Verify the file was created
-    assert output_path.exists()
-    
-    # Open and verify it's a JPEG
-    with Image.open(output_path) as img:
-        assert img.format == "JPEG"
-        assert img.size[0] == 50
-
-
-def test_resize_cli_command(runner, temp_output_dir):
+def test_resize_cli_command(runner, temp_output_dir, sample_png):
     """Test the resize CLI command."""
-    input_path = create_test_image(temp_output_dir / "original.png")
+    input_path = sample_png
     output_path = temp_output_dir / "resized_cli.png"
     
     # Test basic resize
@@ -138,35 +92,23 @@ def test_resize_cli_command(runner, temp_output_dir):
     assert "Error" in result.stdout
 
 
-def test_convert_image(temp_output_dir):
+def test_convert_image(temp_output_dir, sample_png):
     """Test basic image conversion."""
-    input_path = create_test_image(temp_output_dir / "original.png")
+    input_path = sample_png
     output_path = temp_output_dir / "converted.jpg"
     
     ImageConverter.convert_image(input_path, output_path)
     assert output_path.exists()
 
 
-def test_convert_cli_command(runner, temp_output_dir):
-    """Test the convert CLI command."""
-    input_path = create_test_image(temp_output_dir / "original.png")
-    output_path = temp_output_dir / "converted.jpg"
-    
-    result = runner.invoke(app, ["convert", str(input_path), str(output_path)])
-    assert result.exit_code == 0
-    assert output_path.exists()
-
-
-def test_rotate_image_90_degrees(tmp_path):
+def test_rotate_image_90_degrees(tmp_path, sample_png):
     """Test rotating an image by 90 degrees."""
     # Create test image
-    input_path = tmp_path / "test_input.png"
+    input_path = sample_png
     output_path = tmp_path / "test_output.png"
-    create_test_image(input_path)
 
     # Rotate image
-    converter = ImageConverter()
-    converter.rotate_image(input_path, output_path, angle=90)
+    ImageConverter.rotate_image(input_path, output_path, angle=90)
 
     # Verify output exists and is valid
     assert output_path.exists()
@@ -175,14 +117,12 @@ def test_rotate_image_90_degrees(tmp_path):
         assert img.size[1] == TEST_WIDTH
 
 
-def test_rotate_image_custom_angle(tmp_path):
+def test_rotate_image_custom_angle(tmp_path, sample_png):
     """Test rotating an image by a custom angle."""
-    input_path = tmp_path / "test_input.png"
+    input_path = sample_png
     output_path = tmp_path / "test_output.png"
-    create_test_image(input_path)
 
-    converter = ImageConverter()
-    converter.rotate_image(input_path, output_path, angle=45, expand=True)
+    ImageConverter.rotate_image(input_path, output_path, angle=45, expand=True)
 
     assert output_path.exists()
     with Image.open(output_path) as img:
@@ -191,14 +131,12 @@ def test_rotate_image_custom_angle(tmp_path):
         assert img.size[1] > TEST_HEIGHT
 
 
-def test_rotate_image_no_expand(tmp_path):
+def test_rotate_image_no_expand(tmp_path, sample_png):
     """Test rotating an image without expanding."""
-    input_path = tmp_path / "test_input.png"
+    input_path = sample_png
     output_path = tmp_path / "test_output.png"
-    create_test_image(input_path)
 
-    converter = ImageConverter()
-    converter.rotate_image(input_path, output_path, angle=45, expand=False)
+    ImageConverter.rotate_image(input_path, output_path, angle=45, expand=False)
 
     assert output_path.exists()
     with Image.open(output_path) as img:
@@ -206,14 +144,12 @@ def test_rotate_image_no_expand(tmp_path):
         assert img.size[1] == TEST_HEIGHT
 
 
-def test_rotate_image_with_quality(tmp_path):
+def test_rotate_image_with_quality(tmp_path, sample_png):
     """Test rotating an image with quality setting."""
-    input_path = tmp_path / "test_input.png"
+    input_path = sample_png
     output_path = tmp_path / "test_output.jpg"
-    create_test_image(input_path)
 
-    converter = ImageConverter()
-    converter.rotate_image(input_path, output_path, angle=90, quality=50)
+    ImageConverter.rotate_image(input_path, output_path, angle=90, quality=50)
 
     assert output_path.exists()
     # Verify it's a JPEG
@@ -221,13 +157,24 @@ def test_rotate_image_with_quality(tmp_path):
         assert img.format == "JPEG"
 
 
-def test_rotate_cli_command(tmp_path):
+@pytest.mark.parametrize("angle", [0, 360, -360])
+def test_rotate_image_full_turn_skips_rotate(tmp_path, sample_png, mocker, angle):
+    """Test that a full turn saves the image without rotating a copy."""
+    rotate = mocker.spy(Image.Image, "rotate")
+    output_path = tmp_path / "test_output.png"
+
+    ImageConverter.rotate_image(sample_png, output_path, angle=angle)
+
+    rotate.assert_not_called()
+    with Image.open(output_path) as img:
+        assert img.size == (TEST_WIDTH, TEST_HEIGHT)
+
+
+def test_rotate_cli_command(tmp_path, runner, sample_png):
     """Test the rotate CLI command."""
-    input_path = tmp_path / "test_input.png"
+    input_path = sample_png
     output_path = tmp_path / "test_output.png"
-    create_test_image(input_path)
 
-    runner = CliRunner()
     result = runner.invoke(
         app,
         ["rotate", str(input_path), str(output_path), "--angle", "90"]
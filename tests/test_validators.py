@@ -1,6 +1,7 @@
 """Tests for validation utilities."""
 
 import os
+import sys
 import pytest
 from pathlib import Path
 
@@ -12,31 +13,30 @@ from oneimage.utils.validators import (
 from oneimage.config.settings import SUPPORTED_FORMATS
 
 
-@pytest.mark.parametrize("quality", [
-    1, 50, 100,  # Valid integers
-    "1", "50", "100",  # Valid strings
-    None,  # None is valid (uses default)
-])
-def test_validate_quality_valid(quality):
-    """Test validate_quality with valid inputs."""
+@pytest.mark.parametrize("quality,expect_ok", [
+    (1, True), (50, True), (100, True),  # Valid integers
+    ("1", True), ("50", True), ("100", True),  # Valid strings
+    (None, True),  # None is valid (uses default)
+    (0, False), (101, False),  # Out of range integers
+    ("0", False), ("101", False),  # Out of range strings
+    ("abc", False), ("", False),  # Invalid strings
+    (3.14, False), ([], False), ({}, False),  # Invalid types
+], ids=repr)
+def test_validate_quality(quality, expect_ok):
+    """Test validate_quality with valid and invalid inputs."""
+    if not expect_ok:
+        with pytest.raises(ValidationError):
+            validate_quality(quality)
+        return
+
     result = validate_quality(quality)
-    if quality is not None:
+    if quality is None:
+        assert result is None
+    else:
         assert isinstance(result, int)
         assert 1 <= result <= 100
 
 
-@pytest.mark.parametrize("quality", [
-    0, 101,  # Out of range integers
-    "0", "101",  # Out of range strings
-    "abc", "",  # Invalid strings
-    3.14, [], {},  # Invalid types
-])
-def test_validate_quality_invalid(quality):
-    """Test validate_quality with invalid inputs."""
-    with pytest.raises(ValidationError):
-        validate_quality(quality)
-
-
 def test_validate_image_path_existing(tmp_path):
     """Test validate_image_path with existing file."""
     # Create a test PNG file
@@ -77,6 +77,11 @@ def test_validate_image_path_directory(tmp_path):
         validate_image_path(tmp_path, should_exist=True)
 
 
+# Windows chmod can only toggle the read-only flag; the read bit stays set.
+# Root is not skipped: the check reads the mode bits rather than calling access()
+@pytest.mark.skipif(
+    sys.platform == "win32", reason="chmod cannot remove read permission"
+)
 def test_validate_image_path_no_permissions(tmp_path):
     """Test validate_image_path with permission issues."""
     # Create a test file without read permissions
@@ -101,9 +106,68 @@ def test_validate_image_path_create_parent_dirs(tmp_path):
     assert deep_path.parent.exists()
 
 
-def test_validate_image_path_supported_formats():
+# Sorted so every xdist worker collects the same test ids in the same order
+@pytest.mark.parametrize("fmt", sorted(SUPPORTED_FORMATS))
+def test_validate_image_path_supported_formats(fmt):
     """Test validate_image_path with all supported formats."""
-    for fmt in SUPPORTED_FORMATS:
-        path = Path(f"test{fmt}")
-        # Should not raise for supported formats
-        validate_image_path(path, should_exist=False)
+    # Should not raise for supported formats
+    validate_image_path(Path(f"test{fmt}"), should_exist=False)
+
+
+def test_validate_image_path_rechecks_existence(tmp_path):
+    """Test that a file deleted after validation no longer validates."""
+    test_file = tmp_path / "test.png"
+    test_file.write_bytes(b"dummy image content")
+    assert validate_image_path(test_file, should_exist=True) == test_file.resolve()
+
+    test_file.unlink()
+    with pytest.raises(ValidationError, match="does not exist"):
+        validate_image_path(test_file, should_exist=True)
+
+
+def test_validate_image_path_failures_not_cached(tmp_path):
+    """Test that a failed validation is retried on the next call."""
+    test_file = tmp_path / "later.png"
+
+    with pytest.raises(ValidationError, match="does not exist"):
+        validate_image_path(test_file, should_exist=True)
+
+    test_file.write_bytes(b"dummy image content")
+    assert validate_image_path(test_file, should_exist=True) == test_file.resolve()
+
+
+def test_validate_image_path_applies_dotdot_after_symlinks(tmp_path):
+    """Test that ".." after a symlink leaves the link target, like Path.resolve()."""
+    (tmp_path / "real" / "sub").mkdir(parents=True)
+    (tmp_path / "real" / "x.png").write_bytes(b"dummy image content")
+    (tmp_path / "link").symlink_to(tmp_path / "real" / "sub", target_is_directory=True)
+    path = tmp_path / "link" / ".." / "x.png"
+
+    assert validate_image_path(path, should_exist=True) == path.resolve()
+    assert path.resolve() == tmp_path.resolve() / "real" / "x.png"
+
+
+def test_validate_image_path_resolves_parent_once(tmp_path, mocker):
+    """Test that the parent directory is resolved once for all its files."""
+    for name in ("a.png", "b.png", "c.png"):
+        (tmp_path / name).write_bytes(b"dummy image content")
+    realpath = mocker.spy(os.path, "realpath")
+
+    for name in ("a.png", "b.png", "c.png"):
+        validate_image_path(tmp_path / name, should_exist=True)
+
+    assert realpath.call_count == 1
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="symlinks not supported")
+def test_validate_image_path_symlinked_directory(tmp_path):
+    """Test that a symlinked parent directory is resolved to its target."""
+    real_dir = tmp_path / "real"
+    real_dir.mkdir()
+    (real_dir / "test.png").write_bytes(b"dummy image content")
+    link_dir = tmp_path / "link"
+    link_dir.symlink_to(real_dir, target_is_directory=True)
+
+    result = validate_image_path(link_dir / "test.png", should_exist=True)
+
+    assert result == (real_dir / "test.png").resolve()
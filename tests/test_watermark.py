@@ -1,4 +1,7 @@
 """Tests for watermark functionality."""
+import io
+from functools import lru_cache
+
 import pytest
 from pathlib import Path
 from PIL import Image, ImageFont
@@ -12,14 +15,18 @@ TEST_HEIGHT = 100
 
 class MockFont:
     """Mock font for testing."""
+    # Fixed size for testing (left, top, right, bottom)
+    BBOX = (0, 0, 50, 20)
+    # Drawing only reads the mask, so every call can share one core image
+    MASK = Image.new('L', (50, 20), 255).im
+
     def getbbox(self, text, *args, **kwargs):
         """Return bounding box for text."""
-        return (0, 0, 50, 20)  # Fixed size for testing (left, top, right, bottom)
+        return self.BBOX
     
     def getmask(self, text, *args, **kwargs):
-        """Create a simple mask for text."""
-        mask = Image.new('L', (50, 20), 255)
-        return mask.im  # Return the core image object
+        """Return a simple mask for text."""
+        return self.MASK  # The core image object
 
 @pytest.fixture
 def mock_font(monkeypatch):
@@ -28,16 +35,40 @@ def mock_font(monkeypatch):
         return MockFont()
     monkeypatch.setattr(ImageFont, "truetype", mock_truetype)
     monkeypatch.setattr(ImageFont, "load_default", lambda: MockFont())
+    # Keep mock fonts out of the font and tile caches used by other tests
+    WatermarkProcessor._get_font.cache_clear()
+    WatermarkProcessor._render_text_tile.cache_clear()
+    yield
+    WatermarkProcessor._get_font.cache_clear()
+    WatermarkProcessor._render_text_tile.cache_clear()
+
+@lru_cache(maxsize=None)
+def _encoded_test_image(mode: str, suffix: str) -> bytes:
+    """Encode the white test image once per mode and file format."""
+    buffer = io.BytesIO()
+    img = Image.new(mode, (TEST_WIDTH, TEST_HEIGHT), color='white')
+    format_name = Image.registered_extensions()[suffix.lower()]
+    # Stored (uncompressed) PNG: no deflate on write, a plain copy on read
+    save_params = {"compress_level": 0} if format_name == "PNG" else {}
+    img.save(buffer, format=format_name, **save_params)
+    return buffer.getvalue()
 
 def create_test_image(path: Path, mode: str = 'RGB'):
     """Create a test image for watermark tests."""
-    img = Image.new(mode, (TEST_WIDTH, TEST_HEIGHT), color='white')
-    img.save(path)
+    path = Path(path)
+    path.write_bytes(_encoded_test_image(mode, path.suffix))
 
-@pytest.fixture
-def test_image(tmp_path):
-    """Create a test image."""
-    input_path = tmp_path / "test_input.png"
+def watermark_to_bytes(input_path, suffix, **kwargs):
+    """Watermark an image in memory and reopen the result."""
+    buffer = io.BytesIO()
+    WatermarkProcessor.add_watermark(input_path, buffer, suffix=suffix, **kwargs)
+    buffer.seek(0)
+    return Image.open(buffer)
+
+@pytest.fixture(scope="session")
+def test_image(tmp_path_factory):
+    """Create a test image once per session; copy it before modifying."""
+    input_path = tmp_path_factory.mktemp("imgs") / "test_input.png"
     create_test_image(input_path)
     return input_path
 
@@ -53,43 +84,37 @@ def test_add_watermark_basic(tmp_path, test_image, mock_font):
     
     assert output_path.exists()
     with Image.open(output_path) as img:
+        assert img.format == "PNG"
         assert img.size == (TEST_WIDTH, TEST_HEIGHT)
 
-def test_add_watermark_with_options(tmp_path, test_image, mock_font):
+def test_add_watermark_with_options(test_image, mock_font):
     """Test watermark with custom options."""
-    output_path = tmp_path / "test_output.jpg"
-    
-    WatermarkProcessor.add_watermark(
+    with watermark_to_bytes(
         test_image,
-        output_path,
+        ".jpg",
         text="Custom Test",
         position="center",
         opacity=75,
         font_size=24,
         font_color="red",
         quality=90
-    )
-    
-    assert output_path.exists()
-    with Image.open(output_path) as img:
+    ) as img:
         assert img.format == "JPEG"
 
 def test_add_watermark_rgba_to_jpg(tmp_path, mock_font):
     """Test watermark with RGBA to JPEG conversion."""
     input_path = tmp_path / "test_input.png"
-    output_path = tmp_path / "test_output.jpg"
     create_test_image(input_path, mode='RGBA')
     
-    WatermarkProcessor.add_watermark(
-        input_path,
-        output_path,
-        text="RGBA Test"
-    )
-    
-    assert output_path.exists()
-    with Image.open(output_path) as img:
+    with watermark_to_bytes(input_path, ".jpg", text="RGBA Test") as img:
         assert img.mode == "RGB"
 
+
+def test_add_watermark_to_file_object_needs_suffix(test_image, mock_font):
+    """Test that watermarking into a file object requires an output suffix."""
+    with pytest.raises(ValidationError, match="suffix is required"):
+        WatermarkProcessor.add_watermark(test_image, io.BytesIO(), text="Test")
+
 def test_add_watermark_invalid_position(tmp_path, test_image, mock_font):
     """Test watermark with invalid position."""
     output_path = tmp_path / "test_output.png"
@@ -103,33 +128,40 @@ def test_add_watermark_invalid_position(tmp_path, test_image, mock_font):
     
     assert output_path.exists()
 
-def test_add_watermark_invalid_opacity(tmp_path, test_image, mock_font):
-    """Test watermark with invalid opacity."""
+# Options are validated before any image or font work, so no mock_font
+@pytest.mark.parametrize("options,match", [
+    ({"opacity": 101}, "Opacity must be between 0 and 100"),
+    ({"opacity": -1}, "Opacity must be between 0 and 100"),
+    ({"font_size": 0}, "Font size must be greater than 0"),
+])
+def test_add_watermark_invalid_options(tmp_path, test_image, options, match):
+    """Test watermark with invalid opacity or font size."""
     output_path = tmp_path / "test_output.png"
     
-    with pytest.raises(ValidationError):
+    with pytest.raises(ValidationError, match=match):
         WatermarkProcessor.add_watermark(
             test_image,
             output_path,
             text="Test",
-            opacity=101
+            **options
         )
+    assert not output_path.exists()
 
-def test_add_watermark_all_positions(tmp_path, test_image, mock_font):
+@pytest.mark.parametrize(
+    "pos", ["top-left", "top-right", "bottom-left", "bottom-right", "center"]
+)
+def test_add_watermark_all_positions(tmp_path, test_image, mock_font, pos):
     """Test watermark in all valid positions."""
-    positions = ["top-left", "top-right", "bottom-left", "bottom-right", "center"]
-    
-    for pos in positions:
-        output_path = tmp_path / f"test_output_{pos}.png"
-        
-        WatermarkProcessor.add_watermark(
-            test_image,
-            output_path,
-            text=f"Test {pos}",
-            position=pos
-        )
-        
-        assert output_path.exists()
+    output_path = tmp_path / f"test_output_{pos}.png"
+
+    WatermarkProcessor.add_watermark(
+        test_image,
+        output_path,
+        text=f"Test {pos}",
+        position=pos
+    )
+
+    assert output_path.exists()
 
 def test_add_watermark_invalid_color(tmp_path, test_image, mock_font):
     """Test watermark with invalid color."""
@@ -143,3 +175,108 @@ def test_add_watermark_invalid_color(tmp_path, test_image, mock_font):
     )
     
     assert output_path.exists()
+
+def test_get_font_is_cached(monkeypatch):
+    """Test that fonts are loaded once per size."""
+    calls = []
+    def mock_truetype(path, size):
+        calls.append(size)
+        return MockFont()
+    monkeypatch.setattr(ImageFont, "truetype", mock_truetype)
+    monkeypatch.setattr(WatermarkProcessor, "FONT_PATHS", [__file__])
+    WatermarkProcessor._existing_font_paths.cache_clear()
+    WatermarkProcessor._get_font.cache_clear()
+
+    try:
+        assert WatermarkProcessor._get_font(24) is WatermarkProcessor._get_font(24)
+        WatermarkProcessor._get_font(36)
+        assert calls == [24, 36]
+    finally:
+        WatermarkProcessor._existing_font_paths.cache_clear()
+        WatermarkProcessor._get_font.cache_clear()
+
+def test_add_watermark_text_wider_than_image(tmp_path, test_image):
+    """Test that text overflowing the image is cropped rather than failing."""
+    output_path = tmp_path / "test_output.png"
+
+    WatermarkProcessor.add_watermark(
+        test_image,
+        output_path,
+        text="A watermark much wider than the image",
+        position="center",
+        opacity=100,
+        font_size=40,
+        font_color="black",
+    )
+
+    with Image.open(output_path) as img:
+        assert img.size == (TEST_WIDTH, TEST_HEIGHT)
+        # Some text pixels must have landed on the white image
+        assert img.convert("L").getextrema()[0] < 128
+
+
+def test_text_tile_is_rendered_once(tmp_path, test_image, mocker):
+    """Test that watermarking several images renders the text once."""
+    WatermarkProcessor._render_text_tile.cache_clear()
+    get_font = mocker.spy(WatermarkProcessor, "_get_font")
+    try:
+        for i in range(3):
+            WatermarkProcessor.add_watermark(
+                test_image, tmp_path / f"out{i}.png", text="Batch"
+            )
+        assert WatermarkProcessor._render_text_tile.cache_info().misses == 1
+        assert get_font.call_count == 1
+    finally:
+        WatermarkProcessor._render_text_tile.cache_clear()
+
+def test_add_watermark_rgba_not_converted(tmp_path, mocker):
+    """Test that RGBA inputs are composited without an RGBA copy."""
+    input_path = tmp_path / "rgba.png"
+    create_test_image(input_path, mode='RGBA')
+    convert = mocker.spy(Image.Image, "convert")
+
+    WatermarkProcessor.add_watermark(input_path, tmp_path / "out.png", text="Test")
+
+    assert not any(call.args[1:2] == ('RGBA',) for call in convert.call_args_list)
+    with Image.open(tmp_path / "out.png") as img:
+        assert img.mode == 'RGBA'
+
+def test_apply_watermark_in_memory():
+    """Test watermarking an image that was never written to disk."""
+    img = Image.new('RGBA', (TEST_WIDTH, TEST_HEIGHT), (255, 255, 255, 255))
+    original = img.copy()
+
+    watermarked = WatermarkProcessor.apply_watermark(
+        img, "Test", position="center", opacity=100, font_color="black"
+    )
+
+    assert watermarked is not img
+    assert watermarked.mode == 'RGBA'
+    assert watermarked.size == img.size
+    assert img.tobytes() == original.tobytes()
+    assert watermarked.tobytes() != original.tobytes()
+
+def test_apply_watermark_in_place():
+    """Test that in_place draws directly on RGBA images."""
+    img = Image.new('RGBA', (TEST_WIDTH, TEST_HEIGHT), (255, 255, 255, 255))
+    assert WatermarkProcessor.apply_watermark(img, "Test", in_place=True) is img
+
+def test_apply_watermark_invalid_opacity():
+    """Test that in-memory watermarking validates its options."""
+    with pytest.raises(ValidationError, match="Opacity"):
+        WatermarkProcessor.apply_watermark(
+            Image.new('RGB', (10, 10)), "Test", opacity=101
+        )
+
+@pytest.mark.parametrize("size", [(10, 10), (5, 40), (100, 5)])
+@pytest.mark.parametrize(
+    "pos", ["top-left", "top-right", "bottom-left", "bottom-right", "center"]
+)
+def test_apply_watermark_tiny_image(size, pos):
+    """Test that a tile reaching outside a tiny image is cropped, not an error."""
+    img = Image.new('RGB', size, 'white')
+
+    watermarked = WatermarkProcessor.apply_watermark(img, "Test", pos, font_size=36)
+
+    assert watermarked.size == size
+    assert watermarked.mode == "RGBA"